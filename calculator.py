@@ -1,118 +1,303 @@
 """
 Procurement calculation engine with industry standard multipliers
 """
+from functools import lru_cache
 from typing import Dict, List, Any
 from data_loader import BrandStandards
 
 
+# Bathroom fixtures per guest room: (name, qty per room)
+_BATHROOM_ITEMS = (
+    ('Toilet', 1),
+    ('Sink/Vanity', 1),
+    ('Shower/Bathtub', 1),
+    ('Mirror (Bathroom)', 1),
+    ('Towel Bar', 2),
+    ('Towel Ring', 1),
+    ('Robe Hook', 2),
+    ('Toilet Paper Holder', 1),
+    ('Waste Bin', 1),
+    ('Hairdryer', 1),
+    ('Magnifying Mirror', 1),
+    ('Shower Curtain/Door', 1),
+)
+
+# Additional in-room amenities: (name, qty per room, unit)
+_ADDITIONAL_AMENITIES = (
+    ('Coffee/Tea Set', 1, 'sets'),
+    ('Water Bottles (per day)', 2, 'pcs'),
+    ('Notepad', 1, 'pcs'),
+    ('Pen', 2, 'pcs'),
+    ('Laundry Bag', 1, 'pcs'),
+    ('Shoe Shine Kit', 1, 'pcs'),
+)
+
+# Major kitchen equipment: (name, qty per kitchen, unit)
+_MAJOR_KITCHEN_EQUIPMENT = (
+    ('Commercial Range (6-burner)', 2, 'pcs'),
+    ('Convection Oven', 2, 'pcs'),
+    ('Griddle', 1, 'pcs'),
+    ('Fryer (Deep)', 2, 'pcs'),
+    ('Steamer', 1, 'pcs'),
+    ('Salamander/Broiler', 1, 'pcs'),
+    ('Commercial Refrigerator', 2, 'pcs'),
+    ('Walk-in Freezer', 1, 'pcs'),
+    ('Prep Refrigerator', 2, 'pcs'),
+    ('Ice Machine', 1, 'pcs'),
+    ('Dishwasher (Commercial)', 1, 'pcs'),
+    ('Food Processor', 2, 'pcs'),
+    ('Stand Mixer', 2, 'pcs'),
+    ('Blender', 3, 'pcs'),
+    ('Microwave (Commercial)', 2, 'pcs'),
+)
+
+# Kitchen work stations: (name, qty per kitchen, unit)
+_KITCHEN_WORK_STATIONS = (
+    ('Work Table (Stainless Steel)', 6, 'pcs'),
+    ('Prep Table', 4, 'pcs'),
+    ('Sink (3-compartment)', 2, 'pcs'),
+    ('Hand Wash Sink', 3, 'pcs'),
+    ('Shelving Unit (Stainless)', 8, 'pcs'),
+    ('Exhaust Hood', 3, 'pcs'),
+)
+
+# Small kitchen equipment: (name, qty per kitchen, unit)
+_SMALL_KITCHEN_EQUIPMENT = (
+    ('Cutting Board Set', 10, 'sets'),
+    ('Chef Knife Set', 5, 'sets'),
+    ('Mixing Bowl Set', 5, 'sets'),
+    ('Stock Pot Set', 4, 'sets'),
+    ('Sauce Pan Set', 4, 'sets'),
+    ('Frying Pan Set', 4, 'sets'),
+    ('Baking Sheet Pan', 20, 'pcs'),
+    ('Hotel Pan (Full Size)', 30, 'pcs'),
+    ('Hotel Pan (Half Size)', 30, 'pcs'),
+)
+
+# Restaurant tableware per seat, 3x rotation: (name, qty per seat)
+_TABLEWARE = (
+    ('Dinner Plate', 3),
+    ('Salad/Dessert Plate', 3),
+    ('Bread Plate', 3),
+    ('Soup Bowl', 3),
+    ('Cereal Bowl', 3),
+    ('Coffee Cup & Saucer', 3),
+    ('Tea Cup & Saucer', 3),
+    ('Water Glass', 4),
+    ('Wine Glass (Red)', 2),
+    ('Wine Glass (White)', 2),
+    ('Champagne Flute', 2),
+)
+
+# Restaurant cutlery per seat, 4x rotation: (name, qty per seat)
+_CUTLERY = (
+    ('Dinner Fork', 4),
+    ('Salad Fork', 4),
+    ('Dinner Knife', 4),
+    ('Steak Knife', 3),
+    ('Soup Spoon', 4),
+    ('Teaspoon', 4),
+    ('Dessert Spoon', 4),
+)
+
+# Spa furniture and equipment per treatment room: (name, qty per room, unit)
+_SPA_ITEMS = (
+    ('Treatment Bed/Table', 1, 'pcs'),
+    ('Stool (Therapist)', 1, 'pcs'),
+    ('Side Table/Trolley', 1, 'pcs'),
+    ('Storage Cabinet', 1, 'pcs'),
+    ('Towel Warmer', 1, 'pcs'),
+    ('Robe Hook', 2, 'pcs'),
+)
+
+# Spa linen - higher par level: (name, qty per room, par)
+_SPA_LINEN = (
+    ('Spa Towel', 10, 5),
+    ('Face Towel (Spa)', 10, 5),
+    ('Spa Robe', 4, 3),
+    ('Spa Slipper (Pair)', 4, 3),
+    ('Sheet (Treatment Bed)', 3, 5),
+)
+
+# Pool equipment: (name, qty, par or None)
+_POOL_ITEMS = (
+    ('Pool Lounge Chair', 20, None),
+    ('Pool Umbrella', 10, None),
+    ('Pool Towel', 100, 4),
+    ('Life Ring', 2, None),
+    ('Pool Net/Skimmer', 2, None),
+    ('Pool Vacuum', 1, None),
+    ('Chemical Test Kit', 2, None),
+)
+
+# Gym equipment: (name, qty, unit)
+_GYM_ITEMS = (
+    ('Treadmill', 4, 'pcs'),
+    ('Elliptical Trainer', 3, 'pcs'),
+    ('Exercise Bike', 3, 'pcs'),
+    ('Rowing Machine', 2, 'pcs'),
+    ('Weight Bench', 2, 'pcs'),
+    ('Dumbbell Set (5-50 lbs)', 2, 'sets'),
+    ('Kettlebell Set', 1, 'sets'),
+    ('Yoga Mat', 10, 'pcs'),
+    ('Exercise Ball', 5, 'pcs'),
+    ('Towel (Gym)', 50, 'pcs'),
+    ('Water Cooler', 1, 'pcs'),
+    ('Mirror (Wall)', 3, 'pcs'),
+)
+
+# Public area furniture: (name, qty)
+_PUBLIC_AREA_ITEMS = (
+    ('Reception Desk', 1),
+    ('Reception Chair (Staff)', 3),
+    ('Lobby Sofa (3-seater)', 5),
+    ('Lobby Armchair', 10),
+    ('Coffee Table', 5),
+    ('Side Table', 8),
+    ('Console Table', 2),
+    ('Decorative Rug', 3),
+    ('Artwork/Painting', 15),
+    ('Plant/Planter', 10),
+    ('Luggage Cart', 5),
+    ('Waste Bin (Lobby)', 6),
+    ('Signage (Directional)', 20),
+    ('Concierge Desk', 1),
+    ('Bell Stand', 1),
+)
+
+# Conference room equipment per room: (name, qty per room, unit)
+_CONFERENCE_ITEMS = (
+    ('Conference Table (10-person)', 1, 'pcs'),
+    ('Conference Chair', 12, 'pcs'),
+    ('Projector', 1, 'pcs'),
+    ('Projection Screen', 1, 'pcs'),
+    ('Whiteboard', 1, 'pcs'),
+    ('Flip Chart & Stand', 1, 'pcs'),
+    ('Water Pitcher', 3, 'pcs'),
+    ('Water Glass', 30, 'pcs'),
+    ('Notepad', 20, 'pcs'),
+    ('Pen', 20, 'pcs'),
+)
+
+# Result keys in output order, each computed by _calculate_<key>
+_CATEGORIES = (
+    'summary', 'guest_rooms', 'linen', 'bathroom', 'furniture', 'amenities',
+    'restaurant', 'kitchen', 'spa', 'pool', 'gym', 'public_areas',
+    'conference', 'back_of_house',
+)
+
+# Defaults for configuration keys read by the calculator
+_CONFIG_DEFAULTS = {
+    'hotel_name': 'Unnamed Hotel',
+    'room_types': [],
+    'num_floors': 0,
+    'has_spa': False,
+    'spa_rooms': 4,
+    'has_pool': False,
+    'pool_type': 'Outdoor',
+    'has_gym': False,
+    'num_restaurants': 0,
+    'num_kitchens': 0,
+    'num_conference': 0,
+}
+
+
 class ProcurementCalculator:
     """Calculate procurement requirements based on hotel configuration"""
 
     def __init__(self, config: Dict[str, Any]):
         self.config = config
+        self.settings = {**_CONFIG_DEFAULTS, **config}
         self.brand = config.get('hotel_brand', 'Independent')
         self.brand_standards = BrandStandards.get_standard(self.brand)
         self.results = {}
 
-    def calculate_all(self) -> Dict[str, Any]:
-        """Calculate all procurement categories"""
-
-        self.results = {
-            'summary': self._calculate_summary(),
-            'guest_rooms': self._calculate_guest_rooms(),
-            'linen': self._calculate_linen(),
-            'bathroom': self._calculate_bathroom(),
-            'furniture': self._calculate_furniture(),
-            'amenities': self._calculate_amenities(),
-            'restaurant': self._calculate_restaurant(),
-            'kitchen': self._calculate_kitchen(),
-            'spa': self._calculate_spa(),
-            'pool': self._calculate_pool(),
-            'gym': self._calculate_gym(),
-            'public_areas': self._calculate_public_areas(),
-            'conference': self._calculate_conference(),
-            'back_of_house': self._calculate_back_of_house()
-        }
+        room_types = self.settings['room_types']
+        self.total_rooms = sum(rt['count'] for rt in room_types)
+        self.total_beds = sum(rt['count'] * rt['num_beds'] for rt in room_types)
 
+    def calculate_all(self) -> Dict[str, Any]:
+        """Calculate all procurement categories, reusing results for repeated configs"""
+        try:
+            frozen = _FrozenConfig(self.config)
+        except TypeError:
+            # Config holds values we cannot snapshot; calculate without caching
+            frozen = None
+
+        if frozen is None:
+            cached = self._calculate_categories()
+        else:
+            cached = _calculate_cached(frozen)
+
+        self.results = _copy_results(cached)
         return self.results
 
+    def _calculate_categories(self) -> Dict[str, Any]:
+        """Run every category calculation"""
+        return {
+            name: getattr(self, f'_calculate_{name}')()
+            for name in _CATEGORIES
+        }
+
     def _calculate_summary(self) -> Dict[str, Any]:
         """Calculate overall summary"""
-        room_types = self.config.get('room_types', [])
-        total_rooms = sum([rt['count'] for rt in room_types])
-        total_beds = sum([rt['count'] * rt['num_beds'] for rt in room_types])
+        settings = self.settings
 
         return {
-            'hotel_name': self.config.get('hotel_name', 'Unnamed Hotel'),
+            'hotel_name': settings['hotel_name'],
             'brand': self.brand,
-            'total_rooms': total_rooms,
-            'total_beds': total_beds,
-            'num_floors': self.config.get('num_floors', 0),
-            'room_types_count': len(room_types),
-            'has_spa': self.config.get('has_spa', False),
-            'has_pool': self.config.get('has_pool', False),
-            'has_gym': self.config.get('has_gym', False),
-            'num_restaurants': self.config.get('num_restaurants', 0),
-            'num_kitchens': self.config.get('num_kitchens', 0),
-            'num_conference': self.config.get('num_conference', 0)
+            'total_rooms': self.total_rooms,
+            'total_beds': self.total_beds,
+            'num_floors': settings['num_floors'],
+            'room_types_count': len(settings['room_types']),
+            'has_spa': settings['has_spa'],
+            'has_pool': settings['has_pool'],
+            'has_gym': settings['has_gym'],
+            'num_restaurants': settings['num_restaurants'],
+            'num_kitchens': settings['num_kitchens'],
+            'num_conference': settings['num_conference']
         }
 
     def _calculate_guest_rooms(self) -> List[Dict]:
         """Calculate guest room FF&E"""
         items = []
-        room_types = self.config.get('room_types', [])
+        room_types = self.settings['room_types']
 
         for room_type in room_types:
             room_count = room_type['count']
             num_beds = room_type['num_beds']
             bed_type = room_type['bed_type']
             room_name = room_type['name']
+            bed_size = self._get_bed_size(bed_type)
 
-            # Bed bases
-            items.append({
-                'Category': 'Beds',
-                'Item': f"Bed Base - {bed_type}",
-                'Specification': self._get_bed_size(bed_type),
-                'Room Type': room_name,
-                'Qty per Room': num_beds,
-                'Room Count': room_count,
-                'Total Qty': num_beds * room_count,
-                'Unit': 'pcs',
-                'Notes': ''
-            })
-
-            # Mattresses
-            items.append({
-                'Category': 'Mattresses',
-                'Item': f"Mattress - {bed_type}",
-                'Specification': self._get_bed_size(bed_type),
-                'Room Type': room_name,
-                'Qty per Room': num_beds,
-                'Room Count': room_count,
-                'Total Qty': num_beds * room_count,
-                'Unit': 'pcs',
-                'Notes': f'{self.brand} standard quality'
-            })
-
-            # Mattress protectors
-            items.append({
-                'Category': 'Mattresses',
-                'Item': f"Mattress Protector - Waterproof",
-                'Specification': self._get_bed_size(bed_type),
-                'Room Type': room_name,
-                'Qty per Room': num_beds,
-                'Room Count': room_count,
-                'Total Qty': num_beds * room_count,
-                'Unit': 'pcs',
-                'Notes': 'Waterproof breathable fabric'
-            })
+            # Bed base, mattress and mattress protector per bed
+            specs = (
+                ('Beds', f"Bed Base - {bed_type}", ''),
+                ('Mattresses', f"Mattress - {bed_type}", f'{self.brand} standard quality'),
+                ('Mattresses', "Mattress Protector - Waterproof", 'Waterproof breathable fabric'),
+            )
+
+            items.extend(
+                {
+                    'Category': category,
+                    'Item': item_name,
+                    'Specification': bed_size,
+                    'Room Type': room_name,
+                    'Qty per Room': num_beds,
+                    'Room Count': room_count,
+                    'Total Qty': num_beds * room_count,
+                    'Unit': 'pcs',
+                    'Notes': notes
+                }
+                for category, item_name, notes in specs
+            )
 
         return items
 
     def _calculate_linen(self) -> List[Dict]:
         """Calculate linen requirements with par levels"""
         items = []
-        room_types = self.config.get('room_types', [])
+        room_types = self.settings['room_types']
         par_level = self.config.get('par_level', self.brand_standards['linen_par_level'])
         towel_par = self.brand_standards['towel_par_level']
         reserve_pct = self.config.get('reserve_stock', self.brand_standards['reserve_stock'])
@@ -150,7 +335,7 @@ class ProcurementCalculator:
             for item in linen_items:
                 base_qty = room_count * num_beds * item['per_bed']
                 with_par = base_qty * item['par']
-                final_qty = int(with_par * (1 + reserve_pct / 100))
+                final_qty = int(with_par * (100 + reserve_pct) // 100)
 
                 items.append({
                     'Category': 'Bed Linen',
@@ -171,7 +356,7 @@ class ProcurementCalculator:
             for item in towel_items:
                 base_qty = room_count * item['per_room']
                 with_par = base_qty * item['par']
-                final_qty = int(with_par * (1 + reserve_pct / 100))
+                final_qty = int(with_par * (100 + reserve_pct) // 100)
 
                 items.append({
                     'Category': 'Bathroom Linen',
@@ -192,63 +377,46 @@ class ProcurementCalculator:
 
     def _calculate_bathroom(self) -> List[Dict]:
         """Calculate bathroom fixtures and accessories"""
-        items = []
-        room_types = self.config.get('room_types', [])
-
-        bathroom_items = [
-            {'name': 'Toilet', 'qty': 1},
-            {'name': 'Sink/Vanity', 'qty': 1},
-            {'name': 'Shower/Bathtub', 'qty': 1},
-            {'name': 'Mirror (Bathroom)', 'qty': 1},
-            {'name': 'Towel Bar', 'qty': 2},
-            {'name': 'Towel Ring', 'qty': 1},
-            {'name': 'Robe Hook', 'qty': 2},
-            {'name': 'Toilet Paper Holder', 'qty': 1},
-            {'name': 'Waste Bin', 'qty': 1},
-            {'name': 'Hairdryer', 'qty': 1},
-            {'name': 'Magnifying Mirror', 'qty': 1},
-            {'name': 'Shower Curtain/Door', 'qty': 1},
+        room_types = self.settings['room_types']
+
+        return [
+            {
+                'Category': 'Bathroom Fixtures',
+                'Item': name,
+                'Room Type': room_type['name'],
+                'Qty per Room': qty,
+                'Room Count': room_type['count'],
+                'Total Qty': qty * room_type['count'],
+                'Unit': 'pcs'
+            }
+            for room_type in room_types
+            for name, qty in _BATHROOM_ITEMS
         ]
 
-        for room_type in room_types:
-            for item in bathroom_items:
-                items.append({
-                    'Category': 'Bathroom Fixtures',
-                    'Item': item['name'],
-                    'Room Type': room_type['name'],
-                    'Qty per Room': item['qty'],
-                    'Room Count': room_type['count'],
-                    'Total Qty': item['qty'] * room_type['count'],
-                    'Unit': 'pcs'
-                })
-
-        return items
-
     def _calculate_furniture(self) -> List[Dict]:
         """Calculate furniture based on brand standards"""
-        items = []
-        room_types = self.config.get('room_types', [])
+        room_types = self.settings['room_types']
         furniture_standard = self.brand_standards['room_furniture']
 
-        for room_type in room_types:
-            for furniture_item, qty in furniture_standard.items():
-                items.append({
-                    'Category': 'Guest Room Furniture',
-                    'Item': furniture_item,
-                    'Room Type': room_type['name'],
-                    'Qty per Room': qty,
-                    'Room Count': room_type['count'],
-                    'Total Qty': qty * room_type['count'],
-                    'Unit': 'pcs',
-                    'Brand Standard': self.brand
-                })
-
-        return items
+        return [
+            {
+                'Category': 'Guest Room Furniture',
+                'Item': furniture_item,
+                'Room Type': room_type['name'],
+                'Qty per Room': qty,
+                'Room Count': room_type['count'],
+                'Total Qty': qty * room_type['count'],
+                'Unit': 'pcs',
+                'Brand Standard': self.brand
+            }
+            for room_type in room_types
+            for furniture_item, qty in furniture_standard.items()
+        ]
 
     def _calculate_amenities(self) -> List[Dict]:
         """Calculate room amenities based on brand standards"""
         items = []
-        room_types = self.config.get('room_types', [])
+        room_types = self.settings['room_types']
         amenities_list = self.brand_standards['amenities']
 
         # Amenities are typically per room per day, with stock for multiple days
@@ -276,264 +444,122 @@ class ProcurementCalculator:
                     'Brand Standard': self.brand
                 })
 
-        # Additional amenities
-        additional_amenities = [
-            {'name': 'Coffee/Tea Set', 'per_room': 1},
-            {'name': 'Water Bottles (per day)', 'per_room': 2},
-            {'name': 'Notepad', 'per_room': 1},
-            {'name': 'Pen', 'per_room': 2},
-            {'name': 'Laundry Bag', 'per_room': 1},
-            {'name': 'Shoe Shine Kit', 'per_room': 1},
-        ]
-
-        for room_type in room_types:
-            for item in additional_amenities:
-                items.append({
-                    'Category': 'Room Amenities',
-                    'Item': item['name'],
-                    'Room Type': room_type['name'],
-                    'Qty per Room': item['per_room'],
-                    'Room Count': room_type['count'],
-                    'Total Qty': item['per_room'] * room_type['count'],
-                    'Unit': 'sets' if 'Set' in item['name'] else 'pcs'
-                })
+        items.extend(
+            {
+                'Category': 'Room Amenities',
+                'Item': name,
+                'Room Type': room_type['name'],
+                'Qty per Room': per_room,
+                'Room Count': room_type['count'],
+                'Total Qty': per_room * room_type['count'],
+                'Unit': unit
+            }
+            for room_type in room_types
+            for name, per_room, unit in _ADDITIONAL_AMENITIES
+        )
 
         return items
 
     def _calculate_restaurant(self) -> List[Dict]:
         """Calculate restaurant F&B items"""
-        items = []
-        num_restaurants = self.config.get('num_restaurants', 0)
+        num_restaurants = self.settings['num_restaurants']
 
         if num_restaurants == 0:
-            return items
+            return []
 
-        total_rooms = self.config.get('total_rooms', 50)
+        total_rooms = self.config.get('total_rooms', self.total_rooms)
         # Assume 60-70% seat coverage of total rooms
         seats_per_restaurant = int(total_rooms * 0.65)
 
         # Restaurant furniture
-        furniture_items = [
-            {'name': 'Dining Chair', 'qty': seats_per_restaurant},
-            {'name': 'Dining Table (2-seater)', 'qty': seats_per_restaurant // 6},
-            {'name': 'Dining Table (4-seater)', 'qty': seats_per_restaurant // 3},
-            {'name': 'Dining Table (6-seater)', 'qty': seats_per_restaurant // 8},
-            {'name': 'Buffet Table', 'qty': 3},
-            {'name': 'Service Station', 'qty': 2},
-            {'name': 'Host Stand', 'qty': 1},
-            {'name': 'Highchair', 'qty': 4},
-        ]
-
-        # Tableware - 3x multiplier for rotation
-        tableware_items = [
-            {'name': 'Dinner Plate', 'qty': seats_per_restaurant * 3},
-            {'name': 'Salad/Dessert Plate', 'qty': seats_per_restaurant * 3},
-            {'name': 'Bread Plate', 'qty': seats_per_restaurant * 3},
-            {'name': 'Soup Bowl', 'qty': seats_per_restaurant * 3},
-            {'name': 'Cereal Bowl', 'qty': seats_per_restaurant * 3},
-            {'name': 'Coffee Cup & Saucer', 'qty': seats_per_restaurant * 3},
-            {'name': 'Tea Cup & Saucer', 'qty': seats_per_restaurant * 3},
-            {'name': 'Water Glass', 'qty': seats_per_restaurant * 4},
-            {'name': 'Wine Glass (Red)', 'qty': seats_per_restaurant * 2},
-            {'name': 'Wine Glass (White)', 'qty': seats_per_restaurant * 2},
-            {'name': 'Champagne Flute', 'qty': seats_per_restaurant * 2},
-        ]
-
-        # Cutlery - 4x multiplier
-        cutlery_items = [
-            {'name': 'Dinner Fork', 'qty': seats_per_restaurant * 4},
-            {'name': 'Salad Fork', 'qty': seats_per_restaurant * 4},
-            {'name': 'Dinner Knife', 'qty': seats_per_restaurant * 4},
-            {'name': 'Steak Knife', 'qty': seats_per_restaurant * 3},
-            {'name': 'Soup Spoon', 'qty': seats_per_restaurant * 4},
-            {'name': 'Teaspoon', 'qty': seats_per_restaurant * 4},
-            {'name': 'Dessert Spoon', 'qty': seats_per_restaurant * 4},
-        ]
+        furniture_items = (
+            ('Dining Chair', seats_per_restaurant, 'pcs'),
+            ('Dining Table (2-seater)', seats_per_restaurant // 6, 'pcs'),
+            ('Dining Table (4-seater)', seats_per_restaurant // 3, 'pcs'),
+            ('Dining Table (6-seater)', seats_per_restaurant // 8, 'pcs'),
+            ('Buffet Table', 3, 'pcs'),
+            ('Service Station', 2, 'pcs'),
+            ('Host Stand', 1, 'pcs'),
+            ('Highchair', 4, 'pcs'),
+        )
 
         # Linen - 5x multiplier for rotation
-        linen_items = [
-            {'name': 'Tablecloth', 'qty': (seats_per_restaurant // 4) * 5},
-            {'name': 'Napkin (Cloth)', 'qty': seats_per_restaurant * 5},
-        ]
-
-        for item in furniture_items:
-            items.append({
-                'Category': 'Restaurant Furniture',
-                'Item': item['name'],
-                'Outlets': num_restaurants,
-                'Qty per Outlet': item['qty'],
-                'Total Qty': item['qty'] * num_restaurants,
-                'Unit': 'pcs'
-            })
-
-        for item in tableware_items:
-            items.append({
-                'Category': 'Tableware',
-                'Item': item['name'],
-                'Outlets': num_restaurants,
-                'Seats per Outlet': seats_per_restaurant,
-                'Multiplier': '3x',
-                'Qty per Outlet': item['qty'],
-                'Total Qty': item['qty'] * num_restaurants,
-                'Unit': 'pcs'
-            })
-
-        for item in cutlery_items:
-            items.append({
-                'Category': 'Cutlery',
-                'Item': item['name'],
-                'Outlets': num_restaurants,
-                'Seats per Outlet': seats_per_restaurant,
-                'Multiplier': '4x',
-                'Qty per Outlet': item['qty'],
-                'Total Qty': item['qty'] * num_restaurants,
-                'Unit': 'pcs'
-            })
+        linen_items = (
+            ('Tablecloth', (seats_per_restaurant // 4) * 5),
+            ('Napkin (Cloth)', seats_per_restaurant * 5),
+        )
+
+        items = _scaled_items('Restaurant Furniture', furniture_items,
+                              'Outlets', 'Qty per Outlet', num_restaurants)
+
+        for category, multiplier, table in (('Tableware', '3x', _TABLEWARE),
+                                            ('Cutlery', '4x', _CUTLERY)):
+            items.extend(
+                {
+                    'Category': category,
+                    'Item': name,
+                    'Outlets': num_restaurants,
+                    'Seats per Outlet': seats_per_restaurant,
+                    'Multiplier': multiplier,
+                    'Qty per Outlet': seats_per_restaurant * per_seat,
+                    'Total Qty': seats_per_restaurant * per_seat * num_restaurants,
+                    'Unit': 'pcs'
+                }
+                for name, per_seat in table
+            )
 
-        for item in linen_items:
-            items.append({
+        items.extend(
+            {
                 'Category': 'Restaurant Linen',
-                'Item': item['name'],
+                'Item': name,
                 'Outlets': num_restaurants,
                 'Multiplier': '5x Par',
-                'Qty per Outlet': item['qty'],
-                'Total Qty': item['qty'] * num_restaurants,
+                'Qty per Outlet': qty,
+                'Total Qty': qty * num_restaurants,
                 'Unit': 'pcs'
-            })
+            }
+            for name, qty in linen_items
+        )
 
         return items
 
     def _calculate_kitchen(self) -> List[Dict]:
         """Calculate kitchen equipment"""
-        items = []
-        num_kitchens = self.config.get('num_kitchens', 0)
+        num_kitchens = self.settings['num_kitchens']
 
         if num_kitchens == 0:
-            return items
-
-        # Major equipment
-        major_equipment = [
-            {'name': 'Commercial Range (6-burner)', 'qty': 2},
-            {'name': 'Convection Oven', 'qty': 2},
-            {'name': 'Griddle', 'qty': 1},
-            {'name': 'Fryer (Deep)', 'qty': 2},
-            {'name': 'Steamer', 'qty': 1},
-            {'name': 'Salamander/Broiler', 'qty': 1},
-            {'name': 'Commercial Refrigerator', 'qty': 2},
-            {'name': 'Walk-in Freezer', 'qty': 1},
-            {'name': 'Prep Refrigerator', 'qty': 2},
-            {'name': 'Ice Machine', 'qty': 1},
-            {'name': 'Dishwasher (Commercial)', 'qty': 1},
-            {'name': 'Food Processor', 'qty': 2},
-            {'name': 'Stand Mixer', 'qty': 2},
-            {'name': 'Blender', 'qty': 3},
-            {'name': 'Microwave (Commercial)', 'qty': 2},
+            return []
+
+        return [
+            *_scaled_items('Major Kitchen Equipment', _MAJOR_KITCHEN_EQUIPMENT,
+                           'Kitchens', 'Qty per Kitchen', num_kitchens),
+            *_scaled_items('Kitchen Work Stations', _KITCHEN_WORK_STATIONS,
+                           'Kitchens', 'Qty per Kitchen', num_kitchens),
+            *_scaled_items('Small Kitchen Equipment', _SMALL_KITCHEN_EQUIPMENT,
+                           'Kitchens', 'Qty per Kitchen', num_kitchens),
         ]
 
-        # Work stations
-        work_stations = [
-            {'name': 'Work Table (Stainless Steel)', 'qty': 6},
-            {'name': 'Prep Table', 'qty': 4},
-            {'name': 'Sink (3-compartment)', 'qty': 2},
-            {'name': 'Hand Wash Sink', 'qty': 3},
-            {'name': 'Shelving Unit (Stainless)', 'qty': 8},
-            {'name': 'Exhaust Hood', 'qty': 3},
-        ]
-
-        # Small equipment
-        small_equipment = [
-            {'name': 'Cutting Board Set', 'qty': 10},
-            {'name': 'Chef Knife Set', 'qty': 5},
-            {'name': 'Mixing Bowl Set', 'qty': 5},
-            {'name': 'Stock Pot Set', 'qty': 4},
-            {'name': 'Sauce Pan Set', 'qty': 4},
-            {'name': 'Frying Pan Set', 'qty': 4},
-            {'name': 'Baking Sheet Pan', 'qty': 20},
-            {'name': 'Hotel Pan (Full Size)', 'qty': 30},
-            {'name': 'Hotel Pan (Half Size)', 'qty': 30},
-        ]
-
-        for item in major_equipment:
-            items.append({
-                'Category': 'Major Kitchen Equipment',
-                'Item': item['name'],
-                'Kitchens': num_kitchens,
-                'Qty per Kitchen': item['qty'],
-                'Total Qty': item['qty'] * num_kitchens,
-                'Unit': 'pcs'
-            })
-
-        for item in work_stations:
-            items.append({
-                'Category': 'Kitchen Work Stations',
-                'Item': item['name'],
-                'Kitchens': num_kitchens,
-                'Qty per Kitchen': item['qty'],
-                'Total Qty': item['qty'] * num_kitchens,
-                'Unit': 'pcs'
-            })
-
-        for item in small_equipment:
-            items.append({
-                'Category': 'Small Kitchen Equipment',
-                'Item': item['name'],
-                'Kitchens': num_kitchens,
-                'Qty per Kitchen': item['qty'],
-                'Total Qty': item['qty'] * num_kitchens,
-                'Unit': 'sets' if 'Set' in item['name'] else 'pcs'
-            })
-
-        return items
-
     def _calculate_spa(self) -> List[Dict]:
         """Calculate spa equipment and supplies"""
-        items = []
-
-        if not self.config.get('has_spa', False):
-            return items
+        if not self.settings['has_spa']:
+            return []
 
-        spa_rooms = self.config.get('spa_rooms', 4)
+        spa_rooms = self.settings['spa_rooms']
 
-        # Spa furniture and equipment per treatment room
-        spa_items = [
-            {'name': 'Treatment Bed/Table', 'per_room': 1},
-            {'name': 'Stool (Therapist)', 'per_room': 1},
-            {'name': 'Side Table/Trolley', 'per_room': 1},
-            {'name': 'Storage Cabinet', 'per_room': 1},
-            {'name': 'Towel Warmer', 'per_room': 1},
-            {'name': 'Robe Hook', 'per_room': 2},
-        ]
+        items = _scaled_items('Spa Equipment', _SPA_ITEMS,
+                              'Treatment Rooms', 'Qty per Room', spa_rooms)
 
-        # Spa linen - higher par level
-        spa_linen = [
-            {'name': 'Spa Towel', 'per_room': 10, 'par': 5},
-            {'name': 'Face Towel (Spa)', 'per_room': 10, 'par': 5},
-            {'name': 'Spa Robe', 'per_room': 4, 'par': 3},
-            {'name': 'Spa Slipper (Pair)', 'per_room': 4, 'par': 3},
-            {'name': 'Sheet (Treatment Bed)', 'per_room': 3, 'par': 5},
-        ]
-
-        for item in spa_items:
-            items.append({
-                'Category': 'Spa Equipment',
-                'Item': item['name'],
-                'Treatment Rooms': spa_rooms,
-                'Qty per Room': item['per_room'],
-                'Total Qty': item['per_room'] * spa_rooms,
-                'Unit': 'pcs'
-            })
-
-        for item in spa_linen:
-            base = item['per_room'] * spa_rooms
-            total = base * item['par']
+        for name, per_room, par in _SPA_LINEN:
+            base = per_room * spa_rooms
+            total = base * par
 
             items.append({
                 'Category': 'Spa Linen',
-                'Item': item['name'],
+                'Item': name,
                 'Treatment Rooms': spa_rooms,
-                'Per Room': item['per_room'],
+                'Per Room': per_room,
                 'Base Qty': base,
-                'Par Level': item['par'],
+                'Par Level': par,
                 'Total Qty': total,
                 'Unit': 'pcs'
             })
@@ -544,140 +570,68 @@ class ProcurementCalculator:
         """Calculate pool equipment"""
         items = []
 
-        if not self.config.get('has_pool', False):
+        if not self.settings['has_pool']:
             return items
 
-        pool_type = self.config.get('pool_type', 'Outdoor')
+        pool_type = self.settings['pool_type']
 
-        pool_items = [
-            {'name': 'Pool Lounge Chair', 'qty': 20},
-            {'name': 'Pool Umbrella', 'qty': 10},
-            {'name': 'Pool Towel', 'qty': 100, 'par': 4},
-            {'name': 'Life Ring', 'qty': 2},
-            {'name': 'Pool Net/Skimmer', 'qty': 2},
-            {'name': 'Pool Vacuum', 'qty': 1},
-            {'name': 'Chemical Test Kit', 'qty': 2},
-        ]
-
-        for item in pool_items:
-            qty = item['qty']
-            if 'par' in item:
-                qty = item['qty'] * item['par']
+        for name, qty, par in _POOL_ITEMS:
+            if par is not None:
+                qty = qty * par
 
             items.append({
                 'Category': 'Pool Equipment',
-                'Item': item['name'],
+                'Item': name,
                 'Pool Type': pool_type,
                 'Total Qty': qty,
                 'Unit': 'pcs',
-                'Notes': f"Par {item['par']}x" if 'par' in item else ''
+                'Notes': f"Par {par}x" if par is not None else ''
             })
 
         return items
 
     def _calculate_gym(self) -> List[Dict]:
         """Calculate gym equipment"""
-        items = []
-
-        if not self.config.get('has_gym', False):
-            return items
+        if not self.settings['has_gym']:
+            return []
 
-        gym_items = [
-            {'name': 'Treadmill', 'qty': 4},
-            {'name': 'Elliptical Trainer', 'qty': 3},
-            {'name': 'Exercise Bike', 'qty': 3},
-            {'name': 'Rowing Machine', 'qty': 2},
-            {'name': 'Weight Bench', 'qty': 2},
-            {'name': 'Dumbbell Set (5-50 lbs)', 'qty': 2},
-            {'name': 'Kettlebell Set', 'qty': 1},
-            {'name': 'Yoga Mat', 'qty': 10},
-            {'name': 'Exercise Ball', 'qty': 5},
-            {'name': 'Towel (Gym)', 'qty': 50},
-            {'name': 'Water Cooler', 'qty': 1},
-            {'name': 'Mirror (Wall)', 'qty': 3},
-        ]
-
-        for item in gym_items:
-            items.append({
+        return [
+            {
                 'Category': 'Gym Equipment',
-                'Item': item['name'],
-                'Total Qty': item['qty'],
-                'Unit': 'sets' if 'Set' in item['name'] else 'pcs'
-            })
-
-        return items
+                'Item': name,
+                'Total Qty': qty,
+                'Unit': unit
+            }
+            for name, qty, unit in _GYM_ITEMS
+        ]
 
     def _calculate_public_areas(self) -> List[Dict]:
         """Calculate public area furniture"""
-        items = []
-
-        public_items = [
-            {'name': 'Reception Desk', 'qty': 1},
-            {'name': 'Reception Chair (Staff)', 'qty': 3},
-            {'name': 'Lobby Sofa (3-seater)', 'qty': 5},
-            {'name': 'Lobby Armchair', 'qty': 10},
-            {'name': 'Coffee Table', 'qty': 5},
-            {'name': 'Side Table', 'qty': 8},
-            {'name': 'Console Table', 'qty': 2},
-            {'name': 'Decorative Rug', 'qty': 3},
-            {'name': 'Artwork/Painting', 'qty': 15},
-            {'name': 'Plant/Planter', 'qty': 10},
-            {'name': 'Luggage Cart', 'qty': 5},
-            {'name': 'Waste Bin (Lobby)', 'qty': 6},
-            {'name': 'Signage (Directional)', 'qty': 20},
-            {'name': 'Concierge Desk', 'qty': 1},
-            {'name': 'Bell Stand', 'qty': 1},
-        ]
-
-        for item in public_items:
-            items.append({
+        return [
+            {
                 'Category': 'Public Areas',
-                'Item': item['name'],
-                'Total Qty': item['qty'],
+                'Item': name,
+                'Total Qty': qty,
                 'Unit': 'pcs'
-            })
-
-        return items
+            }
+            for name, qty in _PUBLIC_AREA_ITEMS
+        ]
 
     def _calculate_conference(self) -> List[Dict]:
         """Calculate conference room equipment"""
-        items = []
-        num_conference = self.config.get('num_conference', 0)
+        num_conference = self.settings['num_conference']
 
         if num_conference == 0:
-            return items
-
-        # Per conference room
-        conference_items = [
-            {'name': 'Conference Table (10-person)', 'qty': 1},
-            {'name': 'Conference Chair', 'qty': 12},
-            {'name': 'Projector', 'qty': 1},
-            {'name': 'Projection Screen', 'qty': 1},
-            {'name': 'Whiteboard', 'qty': 1},
-            {'name': 'Flip Chart & Stand', 'qty': 1},
-            {'name': 'Water Pitcher', 'qty': 3},
-            {'name': 'Water Glass', 'qty': 30},
-            {'name': 'Notepad', 'qty': 20},
-            {'name': 'Pen', 'qty': 20},
-        ]
-
-        for item in conference_items:
-            items.append({
-                'Category': 'Conference Room',
-                'Item': item['name'],
-                'Rooms': num_conference,
-                'Qty per Room': item['qty'],
-                'Total Qty': item['qty'] * num_conference,
-                'Unit': 'pcs'
-            })
+            return []
 
-        return items
+        return _scaled_items('Conference Room', _CONFERENCE_ITEMS,
+                             'Rooms', 'Qty per Room', num_conference)
 
     def _calculate_back_of_house(self) -> List[Dict]:
         """Calculate back of house equipment"""
         items = []
 
-        total_rooms = self.config.get('total_rooms', 50)
+        total_rooms = self.config.get('total_rooms', self.total_rooms)
 
         # Office furniture - scales with hotel size
         staff_count = int(total_rooms * 0.5)  # Rough estimate
@@ -715,3 +669,61 @@ class ProcurementCalculator:
             'Single': '100x200 cm'
         }
         return sizes.get(bed_type, '100x200 cm')
+
+
+def _scaled_items(category: str, table: tuple, count_label: str,
+                  per_label: str, count: int) -> List[Dict]:
+    """Build rows for (name, qty, unit) items whose total scales with a count"""
+    return [
+        {
+            'Category': category,
+            'Item': name,
+            count_label: count,
+            per_label: qty,
+            'Total Qty': qty * count,
+            'Unit': unit
+        }
+        for name, qty, unit in table
+    ]
+
+
+def _freeze(value: Any) -> Any:
+    """Convert nested dicts and lists into hashable tuples, tagged with type so True/1 and 2/2.0 stay distinct"""
+    if isinstance(value, dict):
+        items = sorted(value.items(), key=lambda pair: pair[0])
+        return (dict, tuple((_freeze(key), _freeze(item)) for key, item in items))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(item) for item in value))
+    hash(value)
+    return (type(value), value)
+
+
+class _FrozenConfig:
+    """Hashable snapshot of a calculator config, used as the results cache key"""
+
+    __slots__ = ('config', 'key', '_hash')
+
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+        self.key = _freeze(config)
+        self._hash = hash(self.key)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, _FrozenConfig) and self.key == other.key
+
+
+@lru_cache(maxsize=256)
+def _calculate_cached(frozen: _FrozenConfig) -> Dict[str, Any]:
+    """Calculate results once per distinct config"""
+    return ProcurementCalculator(frozen.config)._calculate_categories()
+
+
+def _copy_results(results: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy cached results so callers can modify them; rows only hold scalars"""
+    return {
+        name: dict(value) if isinstance(value, dict) else [dict(row) for row in value]
+        for name, value in results.items()
+    }
@@ -1,12 +1,29 @@
 """
 Data loader module to extract and process existing Excel procurement data
 """
-import pandas as pd
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property
+from types import MappingProxyType
 import openpyxl
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Mapping
 import warnings
 warnings.filterwarnings('ignore')
 
+# Result key -> loader method, in load order
+_SHEET_LOADERS = (
+    ('beds_linen', 'load_beds_and_linen'),
+    ('furniture', 'load_furniture'),
+    ('restaurant', 'load_restaurant'),
+    ('kitchen', 'load_kitchen'),
+    ('amenities', 'load_amenities'),
+    ('ff_and_e', 'load_ff_and_e_checklist'),
+)
+
+# With parallel=True, workbooks at least this large are parsed with one worker process per sheet
+_PARALLEL_MIN_BYTES = 1024 * 1024
+
 class ProcurementDataLoader:
     """Load and process procurement data from existing Excel files"""
 
@@ -14,49 +31,124 @@ class ProcurementDataLoader:
         self.excel_path = excel_path
         self.workbook = None
         self.data = {}
+        # (beds_linen records, config) the room configuration was derived from
+        self._room_config = None
+
+    def _open(self):
+        """Open the workbook once in read-only streaming mode"""
+        if self.workbook is None:
+            self.workbook = openpyxl.load_workbook(
+                self.excel_path, read_only=True, data_only=True, keep_links=False
+            )
+        return self.workbook
+
+    def close(self):
+        """Release the workbook file handle"""
+        if self.workbook is not None:
+            self.workbook.close()
+            self.workbook = None
+
+    def _iter_rows(self, sheet_name: str, **bounds):
+        """Stream value rows of a sheet from the shared workbook handle"""
+        wb = self._open()
+        if sheet_name not in wb.sheetnames:
+            return iter(())
+        ws = wb[sheet_name]
+        # Read-only sheets are bounded by the stored <dimension> tag, which some tools leave stale
+        ws.reset_dimensions()
+        return ws.iter_rows(values_only=True, **bounds)
+
+    def load_all_data(self, parallel: bool = False) -> Dict[str, Any]:
+        """Load all procurement data from Excel; parallel=True parses large workbooks in worker processes"""
+        # Drop previously loaded sheets so they are re-read (and the room config with them)
+        for key, _ in _SHEET_LOADERS:
+            self.__dict__.pop(key, None)
 
-    def load_all_data(self) -> Dict[str, Any]:
-        """Load all procurement data from Excel"""
         try:
-            self.workbook = pd.ExcelFile(self.excel_path)
-
-            # Load different categories
-            self.data = {
-                'beds_linen': self.load_beds_and_linen(),
-                'furniture': self.load_furniture(),
-                'restaurant': self.load_restaurant(),
-                'kitchen': self.load_kitchen(),
-                'amenities': self.load_amenities(),
-                'ff_and_e': self.load_ff_and_e_checklist()
-            }
+            # Opt-in: each worker re-opens the workbook and re-parses shared strings,
+            # and forking from a multithreaded host is unsafe, so no gain is assumed
+            if (parallel and (os.cpu_count() or 1) > 1
+                    and os.path.getsize(self.excel_path) >= _PARALLEL_MIN_BYTES):
+                with ProcessPoolExecutor(max_workers=4) as executor:
+                    futures = {
+                        key: executor.submit(_load_sheet, self.excel_path, method)
+                        for key, method in _SHEET_LOADERS
+                    }
+                    self.data = {key: future.result() for key, future in futures.items()}
+                # Seed the lazy properties with the worker results
+                self.__dict__.update(self.data)
+            else:
+                # Default: one shared handle, sheets in order
+                self._open()
+                self.data = {key: getattr(self, key) for key, _ in _SHEET_LOADERS}
 
             return self.data
         except Exception as e:
             print(f"Error loading data: {str(e)}")
             return {}
+        finally:
+            self.close()
+
+    def _load_lazily(self, method: str):
+        """Run a loader method, closing the workbook afterwards unless a bulk load holds it open"""
+        owns_workbook = self.workbook is None
+        try:
+            return getattr(self, method)()
+        finally:
+            if owns_workbook:
+                self.close()
+
+    @cached_property
+    def beds_linen(self) -> List[Dict]:
+        """Beds and linen records, loaded on first access"""
+        return self._load_lazily('load_beds_and_linen')
+
+    @cached_property
+    def furniture(self) -> List[Dict]:
+        """Furniture records, loaded on first access"""
+        return self._load_lazily('load_furniture')
+
+    @cached_property
+    def restaurant(self) -> List[Dict]:
+        """Restaurant records, loaded on first access"""
+        return self._load_lazily('load_restaurant')
+
+    @cached_property
+    def kitchen(self) -> List[Dict]:
+        """Kitchen equipment records, loaded on first access"""
+        return self._load_lazily('load_kitchen')
+
+    @cached_property
+    def amenities(self) -> List[Dict]:
+        """Amenity records, loaded on first access"""
+        return self._load_lazily('load_amenities')
+
+    @cached_property
+    def ff_and_e(self) -> Dict[str, List[Dict]]:
+        """FF&E checklist by area, loaded on first access"""
+        return self._load_lazily('load_ff_and_e_checklist')
 
     def load_beds_and_linen(self) -> List[Dict]:
         """Load beds, mattresses, and linen data"""
         items = []
 
         try:
-            df = pd.read_excel(self.workbook, sheet_name='Beds, Mattress & Linen', header=None)
-
             # Extract bed configuration
             # Row 2: Headers - Units, Size, STD, DLX, SUITE, EXTRA, etc.
             # Row 3-5: Bed data
+            rows = list(self._iter_rows('Beds, Mattress & Linen', max_row=5, max_col=2))
 
             # Beds
-            if len(df) > 3:
-                std_rooms = df.iloc[2, 1] if pd.notna(df.iloc[2, 1]) else 0
-                dlx_rooms = df.iloc[3, 1] if pd.notna(df.iloc[3, 1]) else 0
-                suite_rooms = df.iloc[4, 1] if pd.notna(df.iloc[4, 1]) else 0
+            if len(rows) > 3:
+                std_rooms = rows[2][1]
+                dlx_rooms = rows[3][1]
+                suite_rooms = rows[4][1] if len(rows) > 4 else None
 
                 items.append({
                     'category': 'Room Configuration',
-                    'std_rooms': int(std_rooms) if pd.notna(std_rooms) else 0,
-                    'dlx_rooms': int(dlx_rooms) if pd.notna(dlx_rooms) else 0,
-                    'suite_rooms': int(suite_rooms) if pd.notna(suite_rooms) else 0
+                    'std_rooms': int(std_rooms or 0),
+                    'dlx_rooms': int(dlx_rooms or 0),
+                    'suite_rooms': int(suite_rooms or 0)
                 })
 
             # Linen items - parse the structure
@@ -80,20 +172,17 @@ class ProcurementDataLoader:
         items = []
 
         try:
-            df = pd.read_excel(self.workbook, sheet_name='FURNITURELIST', header=None)
-
-            # Skip header rows and process data
-            for idx in range(3, len(df)):
-                row = df.iloc[idx]
-
-                # Extract furniture code, name, total count
-                if pd.notna(row[0]) and pd.notna(row[1]):
-                    items.append({
-                        'code': str(row[0]),
-                        'name': str(row[1]),
-                        'total': row[2] if pd.notna(row[2]) else 0,
-                        'category': 'Furniture'
-                    })
+            # Skip header rows; extract furniture code, name, total count
+            items = [
+                {
+                    'code': str(code),
+                    'name': str(name),
+                    'total': total or 0,
+                    'category': 'Furniture'
+                }
+                for code, name, total in self._iter_rows('FURNITURELIST', min_row=4, max_col=3)
+                if code is not None and name is not None
+            ]
 
         except Exception as e:
             print(f"Error loading furniture: {str(e)}")
@@ -105,18 +194,16 @@ class ProcurementDataLoader:
         items = []
 
         try:
-            df = pd.read_excel(self.workbook, sheet_name='Restaurant', header=None)
-
             # Process restaurant items
-            for idx in range(2, len(df)):
-                row = df.iloc[idx]
-
-                if pd.notna(row[1]) and pd.notna(row[2]):
-                    items.append({
-                        'item': str(row[1]),
-                        'quantity': row[2] if pd.notna(row[2]) else 0,
-                        'category': 'Restaurant'
-                    })
+            items = [
+                {
+                    'item': str(item),
+                    'quantity': quantity,
+                    'category': 'Restaurant'
+                }
+                for item, quantity in self._iter_rows('Restaurant', min_row=3, min_col=2, max_col=3)
+                if item is not None and quantity is not None
+            ]
 
         except Exception as e:
             print(f"Error loading restaurant: {str(e)}")
@@ -128,21 +215,21 @@ class ProcurementDataLoader:
         items = []
 
         try:
-            df = pd.read_excel(self.workbook, sheet_name='Kitchen', header=None)
-
-            # Process kitchen items starting from row 1 (after header)
-            for idx in range(1, len(df)):
-                row = df.iloc[idx]
-
-                if pd.notna(row[3]):  # Item name is in column 3
-                    items.append({
-                        'item': str(row[3]),
-                        'manufacturer': str(row[4]) if pd.notna(row[4]) else '',
-                        'model': str(row[5]) if pd.notna(row[5]) else '',
-                        'size': str(row[6]) if pd.notna(row[6]) else '',
-                        'quantity': row[7] if pd.notna(row[7]) else 0,
-                        'category': 'Kitchen'
-                    })
+            # Process kitchen items starting from row 1 (after header);
+            # item name is in column 3, followed by manufacturer, model, size, quantity
+            items = [
+                {
+                    'item': str(item),
+                    'manufacturer': str(manufacturer) if manufacturer is not None else '',
+                    'model': str(model) if model is not None else '',
+                    'size': str(size) if size is not None else '',
+                    'quantity': quantity or 0,
+                    'category': 'Kitchen'
+                }
+                for item, manufacturer, model, size, quantity
+                in self._iter_rows('Kitchen', min_row=2, min_col=4, max_col=8)
+                if item is not None
+            ]
 
         except Exception as e:
             print(f"Error loading kitchen: {str(e)}")
@@ -154,17 +241,14 @@ class ProcurementDataLoader:
         items = []
 
         try:
-            if 'AMENITIES' in self.workbook.sheet_names:
-                df = pd.read_excel(self.workbook, sheet_name='AMENITIES', header=None)
-
-                for idx in range(1, len(df)):
-                    row = df.iloc[idx]
-
-                    if pd.notna(row[0]):
-                        items.append({
-                            'item': str(row[0]),
-                            'category': 'Amenities'
-                        })
+            items = [
+                {
+                    'item': str(item),
+                    'category': 'Amenities'
+                }
+                for (item,) in self._iter_rows('AMENITIES', min_row=2, max_col=1)
+                if item is not None
+            ]
 
         except Exception as e:
             print(f"Error loading amenities: {str(e)}")
@@ -180,33 +264,29 @@ class ProcurementDataLoader:
         }
 
         try:
-            df = pd.read_excel(self.workbook, sheet_name='FF&E Checklist', header=None)
-
             # The checklist has multiple columns for different areas
             # Column structure: ROOMS | HALLS & LOBBY | MACHINERY
 
-            for idx in range(1, len(df)):
-                row = df.iloc[idx]
-
+            for row in self._iter_rows('FF&E Checklist', min_row=2, max_col=14):
                 # Rooms items (column 1)
-                if pd.notna(row[1]):
+                if row[1] is not None:
                     checklist['rooms'].append({
                         'item': str(row[1]),
-                        'status': str(row[3]) if pd.notna(row[3]) else ''
+                        'status': str(row[3]) if row[3] is not None else ''
                     })
 
                 # Lobby items (column 6)
-                if pd.notna(row[6]):
+                if row[6] is not None:
                     checklist['lobby'].append({
                         'item': str(row[6]),
-                        'status': str(row[8]) if pd.notna(row[8]) else ''
+                        'status': str(row[8]) if row[8] is not None else ''
                     })
 
                 # Machinery items (column 11)
-                if pd.notna(row[11]):
+                if row[11] is not None:
                     checklist['machinery'].append({
                         'item': str(row[11]),
-                        'status': str(row[13]) if pd.notna(row[13]) else ''
+                        'status': str(row[13]) if row[13] is not None else ''
                     })
 
         except Exception as e:
@@ -215,7 +295,12 @@ class ProcurementDataLoader:
         return checklist
 
     def get_room_configuration(self) -> Dict[str, int]:
-        """Extract room configuration from the data"""
+        """Extract room configuration from the beds and linen sheet (computed once per load)"""
+        records = self.beds_linen
+        # Recompute whenever beds_linen was reloaded or invalidated since the last call
+        if self._room_config is not None and self._room_config[0] is records:
+            return dict(self._room_config[1])
+
         config = {
             'std_rooms': 25,
             'dlx_rooms': 21,
@@ -223,8 +308,8 @@ class ProcurementDataLoader:
             'total_rooms': 50
         }
 
-        if 'beds_linen' in self.data and self.data['beds_linen']:
-            for item in self.data['beds_linen']:
+        if records:
+            for item in records:
                 if item.get('category') == 'Room Configuration':
                     config.update({
                         'std_rooms': item.get('std_rooms', 25),
@@ -238,13 +323,34 @@ class ProcurementDataLoader:
                     )
                     break
 
-        return config
+        self._room_config = (records, config)
+        return dict(config)
+
+
+def _load_sheet(excel_path: str, method: str):
+    """Run one loader method on its own workbook handle (process pool worker)"""
+    loader = ProcurementDataLoader(excel_path)
+    try:
+        return getattr(loader, method)()
+    finally:
+        loader.close()
+
+
+def _freeze_standards(value):
+    """Recursively convert standards to read-only mappings and tuples of interned strings"""
+    if isinstance(value, dict):
+        return MappingProxyType({sys.intern(k): _freeze_standards(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze_standards(v) for v in value)
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
 
 
 class BrandStandards:
     """Hotel brand standards and multipliers"""
 
-    STANDARDS = {
+    STANDARDS = _freeze_standards({
         'Hilton': {
             'linen_par_level': 4,
             'towel_par_level': 5,
@@ -363,10 +469,10 @@ class BrandStandards:
                 'Mirror': 1
             }
         }
-    }
+    })
 
     @classmethod
-    def get_standard(cls, brand: str) -> Dict:
+    def get_standard(cls, brand: str) -> Mapping[str, Any]:
         """Get standards for a specific brand"""
         return cls.STANDARDS.get(brand, cls.STANDARDS['Independent'])
 
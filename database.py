@@ -3,32 +3,124 @@ Database module for storing project history and procurement tracking
 """
 import json
 import os
+import sqlite3
+import stat
+import uuid
+from contextlib import closing
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(data) -> bytes:
+    """Serialize data to indented UTF-8 JSON"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _to_text(data) -> str:
+    """Serialize data to compact JSON text for a SQLite column"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(data, ensure_ascii=False)
+
+
+def _loads(data):
+    """Parse JSON bytes or text"""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Files written by json.dump may hold NaN/Infinity, which only the stdlib parser accepts
+            pass
+    return json.loads(data)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    project_id TEXT PRIMARY KEY,
+    info TEXT NOT NULL,
+    created_at TEXT
+);
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    project_id TEXT NOT NULL,
+    item_index INTEGER NOT NULL,
+    category TEXT,
+    department TEXT,
+    item_data TEXT,
+    capex_info TEXT,
+    status TEXT NOT NULL,
+    audit_trail TEXT,
+    UNIQUE (project_id, item_index)
+);
+CREATE INDEX IF NOT EXISTS idx_items_project_department ON items (project_id, department);
+"""
+
+_ITEM_COLUMNS = 'category, department, item_data, capex_info, status, audit_trail'
+
+# Calculator result categories saved with a project, in save order
+_CATEGORIES = (
+    'guest_rooms', 'linen', 'bathroom', 'furniture', 'amenities',
+    'restaurant', 'kitchen', 'spa', 'pool', 'gym', 'public_areas',
+    'conference', 'back_of_house'
+)
+
+# Category -> owning department
+_DEPT_MAP = {
+    'guest_rooms': 'Rooms Division',
+    'linen': 'Housekeeping',
+    'bathroom': 'Housekeeping',
+    'furniture': 'Rooms Division',
+    'amenities': 'Rooms Division',
+    'restaurant': 'Food & Beverage',
+    'kitchen': 'Food & Beverage',
+    'spa': 'Spa & Wellness',
+    'pool': 'Recreation',
+    'gym': 'Recreation',
+    'public_areas': 'Front Office',
+    'conference': 'Meeting & Events',
+    'back_of_house': 'Back of House'
+}
+
 
 class ProcurementDatabase:
-    """Simple JSON-based database for procurement projects"""
+    """SQLite database for procurement projects, with JSON files for suppliers"""
 
     def __init__(self, db_path='procurement_data'):
         self.db_path = db_path
-        self.projects_file = os.path.join(db_path, 'projects.json')
-        self.items_file = os.path.join(db_path, 'procurement_items.json')
+        self.sqlite_file = os.path.join(db_path, 'procurement.db')
         self.suppliers_file = os.path.join(db_path, 'suppliers.json')
         self.catalogs_file = os.path.join(db_path, 'supplier_catalogs.json')
+        # Legacy JSON layout, imported into SQLite on first start
+        self.projects_file = os.path.join(db_path, 'projects.json')
+        self.items_dir = os.path.join(db_path, 'items')
+        self.items_file = os.path.join(db_path, 'procurement_items.json')
+        self._cache = {}
         self._ensure_db_exists()
 
+    def _connect(self):
+        """Open a connection to the SQLite store"""
+        conn = sqlite3.connect(self.sqlite_file)
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+
     def _ensure_db_exists(self):
-        """Create database directory and files if they don't exist"""
+        """Create database directory, tables and files if they don't exist"""
         if not os.path.exists(self.db_path):
             os.makedirs(self.db_path)
 
-        if not os.path.exists(self.projects_file):
-            self._write_json(self.projects_file, {})
+        with closing(self._connect()) as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(_SCHEMA)
 
-        if not os.path.exists(self.items_file):
-            self._write_json(self.items_file, {})
+        if os.path.exists(self.projects_file):
+            self._migrate_json_store()
 
         if not os.path.exists(self.suppliers_file):
             self._write_json(self.suppliers_file, {})
@@ -36,35 +128,139 @@ class ProcurementDatabase:
         if not os.path.exists(self.catalogs_file):
             self._write_json(self.catalogs_file, {})
 
-    def _read_json(self, file_path):
-        """Read JSON file"""
+    @staticmethod
+    def _load_legacy(file_path, default):
+        """Read a legacy JSON file, letting read and parse errors propagate"""
+        if not os.path.exists(file_path):
+            return default
+        with open(file_path, 'rb') as f:
+            return _loads(f.read())
+
+    def _migrate_json_store(self):
+        """Import projects and items from the legacy JSON files into SQLite"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            projects = self._load_legacy(self.projects_file, {})
+            legacy_items = self._load_legacy(self.items_file, {})
+
+            with closing(self._connect()) as conn, conn:
+                for project_id, project_info in projects.items():
+                    items = legacy_items.get(project_id)
+                    if items is None:
+                        items_path = os.path.join(self.items_dir, f"{project_id}.json")
+                        items = self._load_legacy(items_path, [])
+                    self._insert_project(conn, project_id, project_info, items or [])
         except Exception as e:
+            # Keep the legacy files so the import is retried on the next start
+            print(f"Error migrating legacy JSON store: {e}")
+            return
+
+        # Only retire the legacy files once everything is committed
+        for path in (self.projects_file, self.items_file, self.items_dir):
+            if os.path.exists(path):
+                os.replace(path, path + '.migrated')
+        self._cache.clear()
+
+    def _insert_project(self, conn, project_id: str, project_info: Dict, items: List[Dict]):
+        """Insert or replace a project and its items"""
+        conn.execute(
+            'INSERT OR REPLACE INTO projects (project_id, info, created_at) VALUES (?, ?, ?)',
+            (project_id, _to_text(project_info), project_info.get('created_at'))
+        )
+        conn.execute('DELETE FROM items WHERE project_id = ?', (project_id,))
+        conn.executemany(
+            f'INSERT INTO items (project_id, item_index, {_ITEM_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            [
+                (
+                    project_id,
+                    idx,
+                    item.get('category'),
+                    item.get('department'),
+                    _to_text(item.get('item_data', {})),
+                    _to_text(item['capex_info']) if 'capex_info' in item else None,
+                    _to_text(item.get('procurement_status', {})),
+                    _to_text(item['audit_trail']) if 'audit_trail' in item else None,
+                )
+                for idx, item in enumerate(items)
+            ]
+        )
+
+    @staticmethod
+    def _item_from_row(project_id: str, row) -> Dict:
+        """Rebuild an item record from an items table row"""
+        category, department, item_data, capex_info, status, audit_trail = row
+        item = {
+            'project_id': project_id,
+            'category': category,
+            'department': department,
+            'item_data': _loads(item_data),
+        }
+        if capex_info is not None:
+            item['capex_info'] = _loads(capex_info)
+        item['procurement_status'] = _loads(status)
+        if audit_trail is not None:
+            item['audit_trail'] = _loads(audit_trail)
+        return item
+
+    @staticmethod
+    def _file_key(file_path):
+        """Identify a file revision by its modification time and size"""
+        st = os.stat(file_path)
+        return (st.st_mtime_ns, st.st_size)
+
+    def _read_json(self, file_path, strict=False):
+        """Read JSON file, reusing the parsed data while the file is unchanged"""
+        # strict: re-raise read/parse errors so a read-modify-write never saves {} over the file
+        try:
+            key = self._file_key(file_path)
+            hit = self._cache.get(file_path)
+            if hit is not None and hit[0] == key:
+                return hit[1]
+            with open(file_path, 'rb') as f:
+                data = _loads(f.read())
+            self._cache[file_path] = (key, data)
+            return data
+        except Exception as e:
+            self._cache.pop(file_path, None)
             print(f"Error reading {file_path}: {e}")
+            if strict and not isinstance(e, FileNotFoundError):
+                raise
             return {}
 
     def _write_json(self, file_path, data):
-        """Write JSON file"""
+        """Atomically replace a JSON file and refresh its cache entry"""
+        # One temp file per writer; the database object is shared across sessions
+        tmp_path = f"{file_path}.{uuid.uuid4().hex}.tmp"
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"Error writing {file_path}: {e}")
+            # Keep the mode of the file being replaced; new files get the umask default like open()
+            existing_mode = stat.S_IMODE(os.stat(file_path).st_mode) if os.path.exists(file_path) else None
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL,
+                         0o666 if existing_mode is None else existing_mode)
+            with os.fdopen(fd, 'wb') as f:
+                if existing_mode is not None:
+                    os.fchmod(f.fileno(), existing_mode)
+                f.write(_dumps(data))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
+        except Exception:
+            # Callers mutate the cached object before writing, so drop it
+            self._cache.pop(file_path, None)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self._cache[file_path] = (self._file_key(file_path), data)
 
     def save_project(self, project_data: Dict, results: Dict) -> str:
         """Save a new project"""
-        projects = self._read_json(self.projects_file)
-        items = self._read_json(self.items_file)
-
-        # Generate project ID
-        project_id = datetime.now().strftime('%Y%m%d_%H%M%S')
+        # Generate project ID and timestamps from a single clock read
+        now = datetime.now()
+        timestamp = now.isoformat()
+        project_id = now.strftime('%Y%m%d_%H%M%S')
 
         # Prepare project metadata
         project_info = {
             'project_id': project_id,
-            'created_at': datetime.now().isoformat(),
+            'created_at': timestamp,
             'hotel_info': {
                 'brand': project_data.get('hotel_brand', ''),
                 'property_name': project_data.get('property_name', ''),
@@ -91,33 +287,31 @@ class ProcurementDatabase:
                 }
             },
             'status': 'active',
-            'last_modified': datetime.now().isoformat()
+            'last_modified': timestamp
         }
 
-        # Save project
-        projects[project_id] = project_info
-        self._write_json(self.projects_file, projects)
-
-        # Save procurement items
+        # Build procurement items
         project_items = []
 
         # Process all categories
-        for category in ['guest_rooms', 'linen', 'bathroom', 'furniture', 'amenities',
-                        'restaurant', 'kitchen', 'spa', 'pool', 'gym', 'public_areas',
-                        'conference', 'back_of_house']:
+        for category in _CATEGORIES:
             if results.get(category):
+                department = _DEPT_MAP.get(category, 'General')
+                expense_type = self._get_expense_type(category)
+                depreciation_years = self._get_depreciation_years(category)
+                budget_prefix = self._get_budget_code(category)
                 for item in results[category]:
                     item_record = {
                         'project_id': project_id,
                         'category': category,
-                        'department': self._get_department(category),
+                        'department': department,
                         'item_data': item,
                         # CAPEX Management
                         'capex_info': {
-                            'expense_type': self._get_expense_type(category),  # FF&E, OS&E, or OPEX
-                            'depreciation_years': self._get_depreciation_years(category),
-                            'budget_code': f"{self._get_budget_code(category)}-{item.get('Item', 'ITEM')[:10].upper().replace(' ', '-')}",
-                            'cost_center': self._get_department(category),
+                            'expense_type': expense_type,  # FF&E, OS&E, or OPEX
+                            'depreciation_years': depreciation_years,
+                            'budget_code': f"{budget_prefix}-{item.get('Item', 'ITEM')[:10].upper().replace(' ', '-')}",
+                            'cost_center': department,
                             'budget_amount': 0,  # To be set by user
                             'actual_amount': 0,  # Calculated from unit_price * ordered_qty
                             'variance': 0,  # budget_amount - actual_amount
@@ -154,58 +348,48 @@ class ProcurementDatabase:
                     }
                     project_items.append(item_record)
 
-        items[project_id] = project_items
-        self._write_json(self.items_file, items)
+        # Save project and its items
+        with closing(self._connect()) as conn, conn:
+            self._insert_project(conn, project_id, project_info, project_items)
 
         return project_id
 
-    def _get_department(self, category):
-        """Map category to department"""
-        mapping = {
-            'guest_rooms': 'Rooms Division',
-            'linen': 'Housekeeping',
-            'bathroom': 'Housekeeping',
-            'furniture': 'Rooms Division',
-            'amenities': 'Rooms Division',
-            'restaurant': 'Food & Beverage',
-            'kitchen': 'Food & Beverage',
-            'spa': 'Spa & Wellness',
-            'pool': 'Recreation',
-            'gym': 'Recreation',
-            'public_areas': 'Front Office',
-            'conference': 'Meeting & Events',
-            'back_of_house': 'Back of House'
-        }
-        return mapping.get(category, 'General')
-
     def get_all_projects(self) -> List[Dict]:
         """Get all projects"""
-        projects = self._read_json(self.projects_file)
+        with closing(self._connect()) as conn:
+            rows = conn.execute('SELECT project_id, info FROM projects ORDER BY rowid').fetchall()
         return [
             {
                 'project_id': pid,
-                **pdata
+                **_loads(info)
             }
-            for pid, pdata in projects.items()
+            for pid, info in rows
         ]
 
     def get_project(self, project_id: str) -> Dict:
         """Get a specific project"""
-        projects = self._read_json(self.projects_file)
-        return projects.get(project_id, {})
+        with closing(self._connect()) as conn:
+            row = conn.execute('SELECT info FROM projects WHERE project_id = ?', (project_id,)).fetchone()
+        return _loads(row[0]) if row else {}
 
     def get_project_items(self, project_id: str) -> List[Dict]:
         """Get all items for a project"""
-        items = self._read_json(self.items_file)
-        return items.get(project_id, [])
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                f'SELECT {_ITEM_COLUMNS} FROM items WHERE project_id = ? ORDER BY item_index',
+                (project_id,)
+            ).fetchall()
+        return [self._item_from_row(project_id, row) for row in rows]
 
     def save_supplier(self, supplier_data: Dict) -> str:
         """Create or update a supplier record"""
-        suppliers = self._read_json(self.suppliers_file)
+        suppliers = self._read_json(self.suppliers_file, strict=True)
         supplier_id = supplier_data.get('supplier_id')
+        now = datetime.now()
+        timestamp = now.isoformat()
 
         if not supplier_id:
-            supplier_id = datetime.now().strftime('SUP%Y%m%d_%H%M%S')
+            supplier_id = now.strftime('SUP%Y%m%d_%H%M%S')
 
         suppliers[supplier_id] = {
             'supplier_id': supplier_id,
@@ -217,8 +401,8 @@ class ProcurementDatabase:
             'categories': supplier_data.get('categories', []),
             'contact_person': supplier_data.get('contact_person', ''),
             'notes': supplier_data.get('notes', ''),
-            'updated_at': datetime.now().isoformat(),
-            'created_at': supplier_data.get('created_at') or datetime.now().isoformat(),
+            'updated_at': timestamp,
+            'created_at': supplier_data.get('created_at') or timestamp,
         }
 
         self._write_json(self.suppliers_file, suppliers)
@@ -236,9 +420,10 @@ class ProcurementDatabase:
 
     def save_supplier_catalog(self, supplier_id: str, catalog_data: Dict, items: List[Dict]) -> str:
         """Save a catalog upload for a supplier"""
-        catalogs = self._read_json(self.catalogs_file)
+        catalogs = self._read_json(self.catalogs_file, strict=True)
         supplier_catalogs = catalogs.get(supplier_id, [])
-        catalog_id = datetime.now().strftime('CAT%Y%m%d_%H%M%S')
+        now = datetime.now()
+        catalog_id = now.strftime('CAT%Y%m%d_%H%M%S')
 
         catalog_record = {
             'catalog_id': catalog_id,
@@ -247,7 +432,7 @@ class ProcurementDatabase:
             'source_type': catalog_data.get('source_type', ''),
             'source_name': catalog_data.get('source_name', ''),
             'source_url': catalog_data.get('source_url', ''),
-            'uploaded_at': datetime.now().isoformat(),
+            'uploaded_at': now.isoformat(),
             'image_dir': catalog_data.get('image_dir', ''),
             'image_count': catalog_data.get('image_count', 0),
             'items': items,
@@ -284,35 +469,60 @@ class ProcurementDatabase:
 
     def update_item_status(self, project_id: str, item_index: int, status_update: Dict):
         """Update procurement status of an item"""
-        items = self._read_json(self.items_file)
-
-        if project_id in items and item_index < len(items[project_id]):
-            items[project_id][item_index]['procurement_status'].update(status_update)
-            items[project_id][item_index]['procurement_status']['last_updated'] = datetime.now().isoformat()
-            self._write_json(self.items_file, items)
-            return True
-        return False
+        return self.update_items_status(project_id, [(item_index, status_update)]) == 1
+
+    def update_items_status(self, project_id: str, updates: List[Tuple[int, Dict]]) -> int:
+        """Apply several item status updates in one transaction; returns the number of items updated"""
+        now = datetime.now().isoformat()
+        statuses = {}
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute('BEGIN IMMEDIATE')
+            for item_index, status_update in updates:
+                status = statuses.get(item_index)
+                if status is None:
+                    row = conn.execute(
+                        'SELECT status FROM items WHERE project_id = ? AND item_index = ?',
+                        (project_id, item_index)
+                    ).fetchone()
+                    if row is None:
+                        continue
+                    status = statuses[item_index] = _loads(row[0])
+
+                status.update(status_update)
+                status['last_updated'] = now
+
+            conn.executemany(
+                'UPDATE items SET status = ? WHERE project_id = ? AND item_index = ?',
+                [(_to_text(status), project_id, item_index) for item_index, status in statuses.items()]
+            )
+        return len(statuses)
 
     def get_items_by_department(self, project_id: str, department: str) -> List[Dict]:
         """Get items filtered by department"""
-        all_items = self.get_project_items(project_id)
-        return [item for item in all_items if item['department'] == department]
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                f'SELECT {_ITEM_COLUMNS} FROM items WHERE project_id = ? AND department = ? ORDER BY item_index',
+                (project_id, department)
+            ).fetchall()
+        return [self._item_from_row(project_id, row) for row in rows]
 
     def get_procurement_summary(self, project_id: str) -> Dict:
         """Get procurement status summary"""
-        items = self.get_project_items(project_id)
-
-        total_items = len(items)
-        ordered = sum(1 for item in items if item['procurement_status']['ordered'])
-        received = sum(1 for item in items if item['procurement_status']['received'])
-        installed = sum(1 for item in items if item['procurement_status']['installed'])
-
-        total_budget = sum(item['procurement_status']['total_price'] for item in items)
-        spent = sum(
-            item['procurement_status']['total_price']
-            for item in items
-            if item['procurement_status']['ordered']
-        )
+        with closing(self._connect()) as conn:
+            total_items, ordered, received, installed, total_budget, spent = conn.execute(
+                """
+                SELECT COUNT(*),
+                       COALESCE(SUM(json_extract(status, '$.ordered')), 0),
+                       COALESCE(SUM(json_extract(status, '$.received')), 0),
+                       COALESCE(SUM(json_extract(status, '$.installed')), 0),
+                       COALESCE(SUM(json_extract(status, '$.total_price')), 0),
+                       COALESCE(SUM(CASE WHEN json_extract(status, '$.ordered')
+                                         THEN json_extract(status, '$.total_price') ELSE 0 END), 0)
+                FROM items WHERE project_id = ?
+                """,
+                (project_id,)
+            ).fetchone()
 
         return {
             'total_items': total_items,
@@ -336,7 +546,9 @@ class ProcurementDatabase:
 
         output = BytesIO()
 
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
+        # xlsxwriter's constant_memory mode is not used: pandas writes cells column
+        # by column, and constant_memory keeps only the last row of each column.
+        with pd.ExcelWriter(output, engine='xlsxwriter', engine_kwargs={'options': {'strings_to_urls': False}}) as writer:
             # Project info
             project_info_df = pd.DataFrame([{
                 'Project ID': project_id,
@@ -349,83 +561,86 @@ class ProcurementDatabase:
             }])
             project_info_df.to_excel(writer, sheet_name='Project Info', index=False)
 
-            # Procurement items
-            items_data = []
-            for idx, item in enumerate(items):
-                item_data = item['item_data']
-                status = item['procurement_status']
-
-                record = {
-                    'Index': idx,
-                    'Department': item['department'],
-                    'Category': item['category'],
-                    'Item': item_data.get('Item', item_data.get('item', 'N/A')),
-                    'Specification': item_data.get('Specification', ''),
-                    'Total Qty': item_data.get('Total Qty', item_data.get('Total_Qty', 0)),
-                    'Unit': item_data.get('Unit', 'pcs'),
-                    'Ordered': '✓' if status['ordered'] else '',
-                    'Ordered Date': status['ordered_date'] or '',
-                    'Received': '✓' if status['received'] else '',
-                    'Received Date': status['received_date'] or '',
-                    'Installed': '✓' if status['installed'] else '',
-                    'Supplier': status['supplier'],
-                    'PO Number': status['po_number'],
-                    'Unit Price': status['unit_price'],
-                    'Total Price': status['total_price'],
-                    'Notes': status['notes']
-                }
-                items_data.append(record)
-
-            items_df = pd.DataFrame(items_data)
+            # Procurement items, built column by column
+            item_datas = [item['item_data'] for item in items]
+            statuses = [item['procurement_status'] for item in items]
+
+            items_df = pd.DataFrame({
+                'Index': range(len(items)),
+                'Department': [item['department'] for item in items],
+                'Category': [item['category'] for item in items],
+                'Item': [data.get('Item', data.get('item', 'N/A')) for data in item_datas],
+                'Specification': [data.get('Specification', '') for data in item_datas],
+                'Total Qty': [data.get('Total Qty', data.get('Total_Qty', 0)) for data in item_datas],
+                'Unit': [data.get('Unit', 'pcs') for data in item_datas],
+                'Ordered': ['✓' if status['ordered'] else '' for status in statuses],
+                'Ordered Date': [status['ordered_date'] or '' for status in statuses],
+                'Received': ['✓' if status['received'] else '' for status in statuses],
+                'Received Date': [status['received_date'] or '' for status in statuses],
+                'Installed': ['✓' if status['installed'] else '' for status in statuses],
+                'Supplier': [status['supplier'] for status in statuses],
+                'PO Number': [status['po_number'] for status in statuses],
+                'Unit Price': [status['unit_price'] for status in statuses],
+                'Total Price': [status['total_price'] for status in statuses],
+                'Notes': [status['notes'] for status in statuses]
+            })
             items_df.to_excel(writer, sheet_name='Procurement Items', index=False)
 
             # Summary by department
-            summary_data = []
-            for dept in items_df['Department'].unique():
-                dept_items = items_df[items_df['Department'] == dept]
-                summary_data.append({
-                    'Department': dept,
-                    'Total Items': len(dept_items),
-                    'Ordered': dept_items['Ordered'].str.contains('✓').sum(),
-                    'Received': dept_items['Received'].str.contains('✓').sum(),
-                    'Installed': dept_items['Installed'].str.contains('✓').sum(),
-                    'Total Budget': dept_items['Total Price'].sum()
+            flags = items_df[['Ordered', 'Received', 'Installed']].eq('✓')
+            summary_df = (
+                flags.assign(Department=items_df['Department'], Budget=items_df['Total Price'])
+                .groupby('Department', sort=False)
+                .agg(**{
+                    'Total Items': ('Budget', 'size'),
+                    'Ordered': ('Ordered', 'sum'),
+                    'Received': ('Received', 'sum'),
+                    'Installed': ('Installed', 'sum'),
+                    'Total Budget': ('Budget', 'sum')
                 })
-
-            summary_df = pd.DataFrame(summary_data)
+                .reset_index()
+            )
             summary_df.to_excel(writer, sheet_name='Summary by Department', index=False)
 
         output.seek(0)
         return output.getvalue()
 
+    def _item_totals(self, project_id: str):
+        """Count items and sum their total price in one query"""
+        with closing(self._connect()) as conn:
+            return conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(json_extract(status, '$.total_price')), 0) "
+                "FROM items WHERE project_id = ?",
+                (project_id,)
+            ).fetchone()
+
     def compare_projects(self, project_id_1: str, project_id_2: str) -> Dict:
         """Compare two projects"""
         project1 = self.get_project(project_id_1)
         project2 = self.get_project(project_id_2)
 
-        items1 = self.get_project_items(project_id_1)
-        items2 = self.get_project_items(project_id_2)
+        count1, budget1 = self._item_totals(project_id_1)
+        count2, budget2 = self._item_totals(project_id_2)
 
         comparison = {
             'project1': {
                 'id': project_id_1,
                 'name': project1['hotel_info'].get('property_name', 'Project 1'),
                 'rooms': project1['hotel_info'].get('total_rooms', 0),
-                'total_items': len(items1),
-                'total_budget': sum(item['procurement_status']['total_price'] for item in items1)
+                'total_items': count1,
+                'total_budget': budget1
             },
             'project2': {
                 'id': project_id_2,
                 'name': project2['hotel_info'].get('property_name', 'Project 2'),
                 'rooms': project2['hotel_info'].get('total_rooms', 0),
-                'total_items': len(items2),
-                'total_budget': sum(item['procurement_status']['total_price'] for item in items2)
+                'total_items': count2,
+                'total_budget': budget2
             },
             'differences': {
                 'rooms_diff': project1['hotel_info'].get('total_rooms', 0) - project2['hotel_info'].get('total_rooms', 0),
-                'items_diff': len(items1) - len(items2),
-                'budget_diff': sum(item['procurement_status']['total_price'] for item in items1) -
-                              sum(item['procurement_status']['total_price'] for item in items2)
+                'items_diff': count1 - count2,
+                'budget_diff': budget1 - budget2
             }
         }
 
@@ -508,9 +723,15 @@ class ProcurementDatabase:
 
     def add_audit_entry(self, project_id: str, item_index: int, action: str, user: str, details: dict):
         """Add audit trail entry for CAPEX tracking"""
-        items = self._read_json(self.items_file)
+        with closing(self._connect()) as conn, conn:
+            conn.execute('BEGIN IMMEDIATE')
+            row = conn.execute(
+                'SELECT audit_trail FROM items WHERE project_id = ? AND item_index = ?',
+                (project_id, item_index)
+            ).fetchone()
+            if row is None:
+                return False
 
-        if project_id in items and item_index < len(items[project_id]):
             audit_entry = {
                 'timestamp': datetime.now().isoformat(),
                 'action': action,  # e.g., 'created', 'approved', 'ordered', 'price_changed'
@@ -518,13 +739,13 @@ class ProcurementDatabase:
                 'details': details
             }
 
-            if 'audit_trail' not in items[project_id][item_index]:
-                items[project_id][item_index]['audit_trail'] = []
-
-            items[project_id][item_index]['audit_trail'].append(audit_entry)
-            self._write_json(self.items_file, items)
-            return True
-        return False
+            audit_trail = _loads(row[0]) if row[0] is not None else []
+            audit_trail.append(audit_entry)
+            conn.execute(
+                'UPDATE items SET audit_trail = ? WHERE project_id = ? AND item_index = ?',
+                (_to_text(audit_trail), project_id, item_index)
+            )
+        return True
 
     def get_budget_summary(self, project_id: str) -> Dict:
         """Get budget vs actual summary by department"""
@@ -568,15 +789,8 @@ class ProcurementDatabase:
 
     def delete_project(self, project_id: str) -> bool:
         """Delete a project"""
-        projects = self._read_json(self.projects_file)
-        items = self._read_json(self.items_file)
-
-        if project_id in projects:
-            del projects[project_id]
-            self._write_json(self.projects_file, projects)
-
-        if project_id in items:
-            del items[project_id]
-            self._write_json(self.items_file, items)
+        with closing(self._connect()) as conn, conn:
+            conn.execute('DELETE FROM items WHERE project_id = ?', (project_id,))
+            conn.execute('DELETE FROM projects WHERE project_id = ?', (project_id,))
 
         return True
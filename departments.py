@@ -1,353 +1,302 @@
 """
 Department and subdepartment structure for hotel procurement
 """
+import sys
+from dataclasses import dataclass
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+import numpy as np
+from departments_data import ITEM_ROWS
+
+
+class QtyKind(IntEnum):
+    """What an item's quantity scales with; values index per-kind multiplier tables"""
+    FIXED = 0
+    ROOMS = 1
+    SEATS = 2
+    KITCHEN = 3
+    SPA_ROOMS = 4
+    CONFERENCE = 5
+    BEDS = 6
+    RESTAURANT = 7
+
+
+@dataclass(frozen=True, slots=True)
+class ItemSpec:
+    """Standard item; quantity is qty_factor per unit of qty_kind"""
+    name: str
+    unit: str
+    qty_kind: QtyKind
+    qty_factor: float
+    category: Optional[str] = None
+
+    def __post_init__(self):
+        # Units and names repeat across the table; share one str object each
+        for field in ('name', 'unit', 'category'):
+            value = getattr(self, field)
+            if value is not None:
+                object.__setattr__(self, field, sys.intern(value))
+
+
+# Flyweight pool: equal specs across subdepartments share one instance
+_SPEC_POOL: Dict[ItemSpec, ItemSpec] = {}
+
+
+def _intern_spec(spec: ItemSpec) -> ItemSpec:
+    """Return the pooled instance equal to spec"""
+    return _SPEC_POOL.setdefault(spec, spec)
+
+
+@dataclass(frozen=True)
+class _ItemTable:
+    """Every standard item as parallel arrays, contiguous per department and subdepartment"""
+    specs: Tuple[ItemSpec, ...]
+    names: np.ndarray        # object
+    units: np.ndarray        # object
+    qty_kind: np.ndarray     # int8 QtyKind values
+    qty_factor: np.ndarray   # float64
+    dept_idx: np.ndarray     # int16 index into departments
+    subdept_idx: np.ndarray  # int16 index into subdept_names
+    departments: Tuple[str, ...]
+    subdept_names: Tuple[str, ...]
+    slices: Mapping[Tuple[str, str], slice]
+    dept_slices: Mapping[str, slice]
+
+
+def _frozen_array(values: Sequence, dtype) -> np.ndarray:
+    """Build a read-only array, so the shared table raises on writes like the other frozen tables"""
+    array = np.array(values, dtype=dtype)
+    array.setflags(write=False)
+    return array
+
+
+def _build_item_table() -> _ItemTable:
+    """Flatten ITEM_ROWS into one structure-of-arrays table"""
+    specs: List[ItemSpec] = []
+    dept_idx: List[int] = []
+    subdept_idx: List[int] = []
+    subdept_names: List[str] = []
+    slices: Dict[Tuple[str, str], slice] = {}
+    dept_slices: Dict[str, slice] = {}
+
+    for d, (department, rows) in enumerate(ITEM_ROWS.items()):
+        grouped: Dict[str, List[ItemSpec]] = {}
+        for subdept, name, unit, kind, factor, category in rows:
+            spec = ItemSpec(name, unit, QtyKind[kind.upper()], factor, category)
+            grouped.setdefault(sys.intern(subdept), []).append(_intern_spec(spec))
+
+        dept_start = len(specs)
+        for subdept, items in grouped.items():
+            start = len(specs)
+            specs.extend(items)
+            dept_idx.extend([d] * len(items))
+            subdept_idx.extend([len(subdept_names)] * len(items))
+            subdept_names.append(subdept)
+            slices[(department, subdept)] = slice(start, len(specs))
+        dept_slices[department] = slice(dept_start, len(specs))
+
+    return _ItemTable(
+        specs=tuple(specs),
+        names=_frozen_array([spec.name for spec in specs], object),
+        units=_frozen_array([spec.unit for spec in specs], object),
+        qty_kind=_frozen_array([spec.qty_kind for spec in specs], np.int8),
+        qty_factor=_frozen_array([spec.qty_factor for spec in specs], np.float64),
+        dept_idx=_frozen_array(dept_idx, np.int16),
+        subdept_idx=_frozen_array(subdept_idx, np.int16),
+        departments=tuple(ITEM_ROWS),
+        subdept_names=tuple(subdept_names),
+        slices=MappingProxyType(slices),
+        dept_slices=MappingProxyType(dept_slices),
+    )
+
+
+# Built once at import; every lookup below reads this table
+_ITEM_TABLE = _build_item_table()
+
+
+_STRUCTURE: Dict[str, Tuple[str, ...]] = {
+    'Front Office': (
+        'Reception/Front Desk',
+        'Concierge',
+        'Bell Services',
+        'Business Center',
+        'Guest Relations',
+    ),
+    'Housekeeping': (
+        'Guest Rooms',
+        'Public Areas',
+        'Laundry',
+        'Linen Room',
+        'Housekeeping Office',
+    ),
+    'Food & Beverage': (
+        'Main Kitchen',
+        'Restaurant - Breakfast',
+        'Restaurant - A la Carte',
+        'Room Service',
+        'Banquet/Events',
+        'Bar/Lounge',
+        'Buffet Area',
+        'Pastry/Bakery',
+        'Stewarding',
+    ),
+    'Rooms Division': (
+        'Standard Rooms',
+        'Deluxe Rooms',
+        'Suites',
+        'Accessible Rooms',
+        'Connecting Rooms',
+    ),
+    'Spa & Wellness': (
+        'Treatment Rooms',
+        'Spa Reception',
+        'Relaxation Area',
+        'Wet Area (Sauna/Steam)',
+        'Spa Retail',
+    ),
+    'Recreation': (
+        'Swimming Pool',
+        'Fitness Center/Gym',
+        'Kids Club',
+        'Sports Facilities',
+        'Pool Bar',
+    ),
+    'Meeting & Events': (
+        'Conference Rooms',
+        'Ballroom',
+        'Meeting Rooms (Small)',
+        'Meeting Rooms (Medium)',
+        'Pre-function Areas',
+        'Business Center',
+    ),
+    'Back of House': (
+        'Staff Areas',
+        'Staff Cafeteria',
+        'Lockers & Changing Rooms',
+        'Offices',
+        'Storage',
+        'Maintenance/Engineering',
+        'Security',
+        'IT/Communications',
+    ),
+    'Engineering & Maintenance': (
+        'Workshop',
+        'Electrical Room',
+        'HVAC',
+        'Plumbing',
+        'General Maintenance',
+        'Groundskeeping',
+    ),
+}
+
+
+# UI-only; kept apart so the structure holds just subdepartment names
+_ICONS: Dict[str, str] = {
+    'Front Office': '🏢',
+    'Housekeeping': '🧹',
+    'Food & Beverage': '🍽️',
+    'Rooms Division': '🛏️',
+    'Spa & Wellness': '💆',
+    'Recreation': '🏊',
+    'Meeting & Events': '📊',
+    'Back of House': '🏢',
+    'Engineering & Maintenance': '🔧',
+}
+
+_ALL_DEPARTMENTS = tuple(_STRUCTURE)
+
+_NO_ITEMS: Tuple[ItemSpec, ...] = ()
+
+
+def _build_flat_items() -> Mapping[Tuple[str, str], Tuple[ItemSpec, ...]]:
+    """Check item data against the structure and key each subdepartment's items by (department, subdepartment)"""
+    table = _ITEM_TABLE
+    for department, subdepartment in table.slices:
+        if subdepartment not in _STRUCTURE.get(department, ()):
+            raise ValueError(f"Unknown subdepartment in departments_data: {department} / {subdepartment}")
+    return MappingProxyType({key: table.specs[item_slice] for key, item_slice in table.slices.items()})
+
+
+def _build_department_items() -> Mapping[str, Tuple[Tuple[str, ItemSpec], ...]]:
+    """Pair each department's items with their subdepartment names"""
+    table = _ITEM_TABLE
+    return MappingProxyType({
+        department: tuple(zip(
+            (table.subdept_names[i] for i in table.subdept_idx[dept_slice]),
+            table.specs[dept_slice]
+        ))
+        for department, dept_slice in table.dept_slices.items()
+    })
+
+
+# Built at import so get_items and get_all_items_for_department are single dict probes
+_FLAT_ITEMS = _build_flat_items()
+_DEPARTMENT_ITEMS = _build_department_items()
+
+
+# Lookups are module-level functions; their data is bound as keyword-only default args
+# so the hot path is a LOAD_FAST instead of global/class attribute loads.
+
+def get_all_departments(*, _departments: Tuple[str, ...] = _ALL_DEPARTMENTS) -> Tuple[str, ...]:
+    """Get all departments, in display order"""
+    return _departments
+
+
+def get_subdepartments(department: str, *,
+                       _get: Callable[..., Tuple[str, ...]] = _STRUCTURE.get) -> Tuple[str, ...]:
+    """Get subdepartments for a specific department"""
+    return _get(department, ())
+
+
+def get_icon(department: str, *, _get: Callable[..., str] = _ICONS.get) -> str:
+    """Get icon for a department"""
+    return _get(department, '📋')
+
+
+def get_items(department: str, subdepartment: str, *,
+              _get: Callable[..., Tuple[ItemSpec, ...]] = _FLAT_ITEMS.get) -> Tuple[ItemSpec, ...]:
+    """Get items for a specific department and subdepartment"""
+    return _get((department, subdepartment), _NO_ITEMS)
+
+
+def get_all_items_for_department(department: str, *,
+                                 _get: Callable[..., Tuple[Tuple[str, ItemSpec], ...]] = _DEPARTMENT_ITEMS.get
+                                 ) -> Tuple[Tuple[str, ItemSpec], ...]:
+    """Get (subdepartment, item) pairs for a department across all subdepartments"""
+    return _get(department, ())
+
+
+def get_quantities(multipliers: Sequence[float], department: str,
+                   subdepartment: Optional[str] = None) -> np.ndarray:
+    """Quantities (multipliers[qty_kind] * qty_factor) of a department's or subdepartment's items, in item order"""
+    # multipliers is indexed by QtyKind, e.g. multipliers[QtyKind.ROOMS] = total rooms, [QtyKind.FIXED] = 1
+    table = _ITEM_TABLE
+    if subdepartment is None:
+        item_slice = table.dept_slices.get(department)
+    else:
+        item_slice = table.slices.get((department, subdepartment))
+    if item_slice is None:
+        return np.zeros(0)
+    return np.asarray(multipliers, dtype=np.float64)[table.qty_kind[item_slice]] * table.qty_factor[item_slice]
+
 
 class HotelDepartments:
-    """Define hotel department structure and subdepartments"""
-
-    STRUCTURE = {
-        'Front Office': {
-            'subdepartments': [
-                'Reception/Front Desk',
-                'Concierge',
-                'Bell Services',
-                'Business Center',
-                'Guest Relations'
-            ],
-            'icon': '🏢'
-        },
-        'Housekeeping': {
-            'subdepartments': [
-                'Guest Rooms',
-                'Public Areas',
-                'Laundry',
-                'Linen Room',
-                'Housekeeping Office'
-            ],
-            'icon': '🧹'
-        },
-        'Food & Beverage': {
-            'subdepartments': [
-                'Main Kitchen',
-                'Restaurant - Breakfast',
-                'Restaurant - A la Carte',
-                'Room Service',
-                'Banquet/Events',
-                'Bar/Lounge',
-                'Buffet Area',
-                'Pastry/Bakery',
-                'Stewarding'
-            ],
-            'icon': '🍽️'
-        },
-        'Rooms Division': {
-            'subdepartments': [
-                'Standard Rooms',
-                'Deluxe Rooms',
-                'Suites',
-                'Accessible Rooms',
-                'Connecting Rooms'
-            ],
-            'icon': '🛏️'
-        },
-        'Spa & Wellness': {
-            'subdepartments': [
-                'Treatment Rooms',
-                'Spa Reception',
-                'Relaxation Area',
-                'Wet Area (Sauna/Steam)',
-                'Spa Retail'
-            ],
-            'icon': '💆'
-        },
-        'Recreation': {
-            'subdepartments': [
-                'Swimming Pool',
-                'Fitness Center/Gym',
-                'Kids Club',
-                'Sports Facilities',
-                'Pool Bar'
-            ],
-            'icon': '🏊'
-        },
-        'Meeting & Events': {
-            'subdepartments': [
-                'Conference Rooms',
-                'Ballroom',
-                'Meeting Rooms (Small)',
-                'Meeting Rooms (Medium)',
-                'Pre-function Areas',
-                'Business Center'
-            ],
-            'icon': '📊'
-        },
-        'Back of House': {
-            'subdepartments': [
-                'Staff Areas',
-                'Staff Cafeteria',
-                'Lockers & Changing Rooms',
-                'Offices',
-                'Storage',
-                'Maintenance/Engineering',
-                'Security',
-                'IT/Communications'
-            ],
-            'icon': '🏢'
-        },
-        'Engineering & Maintenance': {
-            'subdepartments': [
-                'Workshop',
-                'Electrical Room',
-                'HVAC',
-                'Plumbing',
-                'General Maintenance',
-                'Groundskeeping'
-            ],
-            'icon': '🔧'
-        }
-    }
-
-    @classmethod
-    def get_all_departments(cls):
-        """Get list of all departments"""
-        return list(cls.STRUCTURE.keys())
-
-    @classmethod
-    def get_subdepartments(cls, department):
-        """Get subdepartments for a specific department"""
-        return cls.STRUCTURE.get(department, {}).get('subdepartments', [])
-
-    @classmethod
-    def get_icon(cls, department):
-        """Get icon for a department"""
-        return cls.STRUCTURE.get(department, {}).get('icon', '📋')
+    """Define hotel department structure and subdepartments (shim over the module functions)"""
+
+    STRUCTURE = MappingProxyType(_STRUCTURE)
+
+    get_all_departments = staticmethod(get_all_departments)
+    get_subdepartments = staticmethod(get_subdepartments)
+    get_icon = staticmethod(get_icon)
 
 
 class DepartmentItems:
-    """Standard items for each department/subdepartment"""
-
-    ITEMS = {
-        'Front Office': {
-            'Reception/Front Desk': [
-                {'item': 'Reception Desk', 'unit': 'pcs', 'qty_formula': 'fixed:1'},
-                {'item': 'Reception Chair (Staff)', 'unit': 'pcs', 'qty_formula': 'fixed:3'},
-                {'item': 'Computer Workstation', 'unit': 'pcs', 'qty_formula': 'fixed:3'},
-                {'item': 'Phone System', 'unit': 'sets', 'qty_formula': 'fixed:1'},
-                {'item': 'Key Card System', 'unit': 'sets', 'qty_formula': 'fixed:1'},
-                {'item': 'Safe Deposit Boxes', 'unit': 'pcs', 'qty_formula': 'rooms:0.5'},
-                {'item': 'Guest Directory/Compendium', 'unit': 'pcs', 'qty_formula': 'rooms:1'},
-            ],
-            'Concierge': [
-                {'item': 'Concierge Desk', 'unit': 'pcs', 'qty_formula': 'fixed:1'},
-                {'item': 'Concierge Chair', 'unit': 'pcs', 'qty_formula': 'fixed:2'},
-                {'item': 'Brochure Display Rack', 'unit': 'pcs', 'qty_formula': 'fixed:2'},
-            ],
-            'Bell Services': [
-                {'item': 'Bell Stand', 'unit': 'pcs', 'qty_formula': 'fixed:1'},
-                {'item': 'Luggage Cart', 'unit': 'pcs', 'qty_formula': 'rooms:0.1'},
-                {'item': 'Luggage Storage Rack', 'unit': 'pcs', 'qty_formula': 'fixed:3'},
-            ],
-        },
-
-        'Housekeeping': {
-            'Guest Rooms': [
-                {'item': 'Bed Base', 'unit': 'pcs', 'category': 'Furniture', 'qty_formula': 'beds:1'},
-                {'item': 'Mattress', 'unit': 'pcs', 'category': 'Furniture', 'qty_formula': 'beds:1'},
-                {'item': 'Bedside Table', 'unit': 'pcs', 'category': 'Furniture', 'qty_formula': 'rooms:2'},
-                {'item': 'Desk', 'unit': 'pcs', 'category': 'Furniture', 'qty_formula': 'rooms:1'},
-                {'item': 'Desk Chair', 'unit': 'pcs', 'category': 'Furniture', 'qty_formula': 'rooms:1'},
-                {'item': 'Lounge Chair', 'unit': 'pcs', 'category': 'Furniture', 'qty_formula': 'rooms:1'},
-                {'item': 'Wardrobe', 'unit': 'pcs', 'category': 'Furniture', 'qty_formula': 'rooms:1'},
-                {'item': 'TV Unit', 'unit': 'pcs', 'category': 'Furniture', 'qty_formula': 'rooms:1'},
-                {'item': 'Luggage Rack', 'unit': 'pcs', 'category': 'Furniture', 'qty_formula': 'rooms:1'},
-                {'item': 'Safe', 'unit': 'pcs', 'category': 'Equipment', 'qty_formula': 'rooms:1'},
-                {'item': 'Mirror', 'unit': 'pcs', 'category': 'Furniture', 'qty_formula': 'rooms:2'},
-                {'item': 'Waste Bin', 'unit': 'pcs', 'category': 'Equipment', 'qty_formula': 'rooms:2'},
-            ],
-            'Laundry': [
-                {'item': 'Commercial Washer', 'unit': 'pcs', 'qty_formula': 'rooms:0.02'},
-                {'item': 'Commercial Dryer', 'unit': 'pcs', 'qty_formula': 'rooms:0.02'},
-                {'item': 'Ironing Station', 'unit': 'pcs', 'qty_formula': 'rooms:0.01'},
-                {'item': 'Laundry Cart', 'unit': 'pcs', 'qty_formula': 'rooms:0.05'},
-                {'item': 'Folding Table', 'unit': 'pcs', 'qty_formula': 'fixed:3'},
-            ],
-            'Linen Room': [
-                {'item': 'Linen Storage Shelving', 'unit': 'units', 'qty_formula': 'fixed:8'},
-                {'item': 'Linen Cart', 'unit': 'pcs', 'qty_formula': 'rooms:0.1'},
-            ],
-            'Housekeeping Office': [
-                {'item': 'Housekeeping Cart', 'unit': 'pcs', 'qty_formula': 'rooms:0.1'},
-                {'item': 'Vacuum Cleaner', 'unit': 'pcs', 'qty_formula': 'rooms:0.067'},
-                {'item': 'Floor Polisher', 'unit': 'pcs', 'qty_formula': 'fixed:2'},
-                {'item': 'Mop & Bucket Set', 'unit': 'sets', 'qty_formula': 'rooms:0.1'},
-            ],
-        },
-
-        'Food & Beverage': {
-            'Main Kitchen': [
-                {'item': 'Commercial Range (6-burner)', 'unit': 'pcs', 'qty_formula': 'kitchen:2'},
-                {'item': 'Convection Oven', 'unit': 'pcs', 'qty_formula': 'kitchen:2'},
-                {'item': 'Griddle', 'unit': 'pcs', 'qty_formula': 'kitchen:1'},
-                {'item': 'Deep Fryer', 'unit': 'pcs', 'qty_formula': 'kitchen:2'},
-                {'item': 'Steamer', 'unit': 'pcs', 'qty_formula': 'kitchen:1'},
-                {'item': 'Salamander/Broiler', 'unit': 'pcs', 'qty_formula': 'kitchen:1'},
-                {'item': 'Commercial Refrigerator', 'unit': 'pcs', 'qty_formula': 'kitchen:2'},
-                {'item': 'Walk-in Freezer', 'unit': 'pcs', 'qty_formula': 'kitchen:1'},
-                {'item': 'Prep Refrigerator', 'unit': 'pcs', 'qty_formula': 'kitchen:2'},
-                {'item': 'Ice Machine', 'unit': 'pcs', 'qty_formula': 'kitchen:1'},
-                {'item': 'Dishwasher (Commercial)', 'unit': 'pcs', 'qty_formula': 'kitchen:1'},
-                {'item': 'Food Processor', 'unit': 'pcs', 'qty_formula': 'kitchen:2'},
-                {'item': 'Stand Mixer', 'unit': 'pcs', 'qty_formula': 'kitchen:2'},
-                {'item': 'Work Table (Stainless)', 'unit': 'pcs', 'qty_formula': 'kitchen:6'},
-                {'item': 'Sink (3-compartment)', 'unit': 'pcs', 'qty_formula': 'kitchen:2'},
-                {'item': 'Exhaust Hood', 'unit': 'pcs', 'qty_formula': 'kitchen:3'},
-                {'item': 'Shelving Unit (Stainless)', 'unit': 'pcs', 'qty_formula': 'kitchen:8'},
-            ],
-            'Restaurant - Breakfast': [
-                {'item': 'Dining Chair', 'unit': 'pcs', 'qty_formula': 'seats:1'},
-                {'item': 'Dining Table (2-seater)', 'unit': 'pcs', 'qty_formula': 'seats:0.15'},
-                {'item': 'Dining Table (4-seater)', 'unit': 'pcs', 'qty_formula': 'seats:0.25'},
-                {'item': 'Service Station', 'unit': 'pcs', 'qty_formula': 'restaurant:2'},
-                {'item': 'Host Stand', 'unit': 'pcs', 'qty_formula': 'restaurant:1'},
-            ],
-            'Restaurant - A la Carte': [
-                {'item': 'Dining Chair', 'unit': 'pcs', 'qty_formula': 'seats:1'},
-                {'item': 'Dining Table (2-seater)', 'unit': 'pcs', 'qty_formula': 'seats:0.2'},
-                {'item': 'Dining Table (4-seater)', 'unit': 'pcs', 'qty_formula': 'seats:0.3'},
-                {'item': 'Dining Table (6-seater)', 'unit': 'pcs', 'qty_formula': 'seats:0.125'},
-                {'item': 'Bar Stool', 'unit': 'pcs', 'qty_formula': 'fixed:12'},
-                {'item': 'Bar Counter', 'unit': 'pcs', 'qty_formula': 'restaurant:1'},
-            ],
-            'Buffet Area': [
-                {'item': 'Buffet Table (Hot)', 'unit': 'pcs', 'qty_formula': 'restaurant:3'},
-                {'item': 'Buffet Table (Cold)', 'unit': 'pcs', 'qty_formula': 'restaurant:3'},
-                {'item': 'Chafing Dish', 'unit': 'pcs', 'qty_formula': 'restaurant:12'},
-                {'item': 'Ice Display Unit', 'unit': 'pcs', 'qty_formula': 'restaurant:2'},
-            ],
-            'Bar/Lounge': [
-                {'item': 'Bar Counter', 'unit': 'pcs', 'qty_formula': 'fixed:1'},
-                {'item': 'Bar Stool', 'unit': 'pcs', 'qty_formula': 'fixed:12'},
-                {'item': 'Lounge Sofa', 'unit': 'pcs', 'qty_formula': 'fixed:5'},
-                {'item': 'Lounge Chair', 'unit': 'pcs', 'qty_formula': 'fixed:8'},
-                {'item': 'Coffee Table', 'unit': 'pcs', 'qty_formula': 'fixed:5'},
-                {'item': 'Back Bar Shelving', 'unit': 'units', 'qty_formula': 'fixed:1'},
-                {'item': 'Glass Washer', 'unit': 'pcs', 'qty_formula': 'fixed:1'},
-                {'item': 'Ice Maker', 'unit': 'pcs', 'qty_formula': 'fixed:1'},
-                {'item': 'Blender', 'unit': 'pcs', 'qty_formula': 'fixed:2'},
-            ],
-            'Room Service': [
-                {'item': 'Room Service Cart', 'unit': 'pcs', 'qty_formula': 'rooms:0.1'},
-                {'item': 'Hot Box/Food Warmer', 'unit': 'pcs', 'qty_formula': 'fixed:3'},
-                {'item': 'Tray Stand', 'unit': 'pcs', 'qty_formula': 'rooms:0.2'},
-            ],
-            'Pastry/Bakery': [
-                {'item': 'Pastry Oven', 'unit': 'pcs', 'qty_formula': 'fixed:2'},
-                {'item': 'Dough Mixer', 'unit': 'pcs', 'qty_formula': 'fixed:2'},
-                {'item': 'Work Table (Marble Top)', 'unit': 'pcs', 'qty_formula': 'fixed:3'},
-                {'item': 'Proof Box', 'unit': 'pcs', 'qty_formula': 'fixed:1'},
-                {'item': 'Display Refrigerator', 'unit': 'pcs', 'qty_formula': 'fixed:2'},
-            ],
-        },
-
-        'Spa & Wellness': {
-            'Treatment Rooms': [
-                {'item': 'Treatment Bed/Table', 'unit': 'pcs', 'qty_formula': 'spa_rooms:1'},
-                {'item': 'Stool (Therapist)', 'unit': 'pcs', 'qty_formula': 'spa_rooms:1'},
-                {'item': 'Side Table/Trolley', 'unit': 'pcs', 'qty_formula': 'spa_rooms:1'},
-                {'item': 'Storage Cabinet', 'unit': 'pcs', 'qty_formula': 'spa_rooms:1'},
-                {'item': 'Towel Warmer', 'unit': 'pcs', 'qty_formula': 'spa_rooms:1'},
-                {'item': 'Robe Hook', 'unit': 'pcs', 'qty_formula': 'spa_rooms:2'},
-            ],
-            'Spa Reception': [
-                {'item': 'Reception Desk', 'unit': 'pcs', 'qty_formula': 'fixed:1'},
-                {'item': 'Reception Chair (Staff)', 'unit': 'pcs', 'qty_formula': 'fixed:2'},
-                {'item': 'Waiting Area Sofa', 'unit': 'pcs', 'qty_formula': 'fixed:2'},
-                {'item': 'Retail Display Shelving', 'unit': 'units', 'qty_formula': 'fixed:3'},
-            ],
-            'Relaxation Area': [
-                {'item': 'Lounge Chair/Recliner', 'unit': 'pcs', 'qty_formula': 'spa_rooms:2'},
-                {'item': 'Side Table', 'unit': 'pcs', 'qty_formula': 'spa_rooms:2'},
-                {'item': 'Water Dispenser', 'unit': 'pcs', 'qty_formula': 'fixed:1'},
-            ],
-        },
-
-        'Recreation': {
-            'Swimming Pool': [
-                {'item': 'Pool Lounge Chair', 'unit': 'pcs', 'qty_formula': 'rooms:0.4'},
-                {'item': 'Pool Umbrella', 'unit': 'pcs', 'qty_formula': 'rooms:0.2'},
-                {'item': 'Side Table (Pool)', 'unit': 'pcs', 'qty_formula': 'rooms:0.2'},
-                {'item': 'Life Ring', 'unit': 'pcs', 'qty_formula': 'fixed:2'},
-                {'item': 'Pool Net/Skimmer', 'unit': 'pcs', 'qty_formula': 'fixed:2'},
-                {'item': 'Pool Vacuum', 'unit': 'pcs', 'qty_formula': 'fixed:1'},
-            ],
-            'Fitness Center/Gym': [
-                {'item': 'Treadmill', 'unit': 'pcs', 'qty_formula': 'rooms:0.08'},
-                {'item': 'Elliptical Trainer', 'unit': 'pcs', 'qty_formula': 'rooms:0.06'},
-                {'item': 'Exercise Bike', 'unit': 'pcs', 'qty_formula': 'rooms:0.06'},
-                {'item': 'Rowing Machine', 'unit': 'pcs', 'qty_formula': 'fixed:2'},
-                {'item': 'Weight Bench', 'unit': 'pcs', 'qty_formula': 'fixed:2'},
-                {'item': 'Dumbbell Set (5-50 lbs)', 'unit': 'sets', 'qty_formula': 'fixed:2'},
-                {'item': 'Kettlebell Set', 'unit': 'sets', 'qty_formula': 'fixed:1'},
-                {'item': 'Yoga Mat', 'unit': 'pcs', 'qty_formula': 'fixed:10'},
-                {'item': 'Mirror (Wall)', 'unit': 'pcs', 'qty_formula': 'fixed:3'},
-            ],
-        },
-
-        'Meeting & Events': {
-            'Conference Rooms': [
-                {'item': 'Conference Table (10-person)', 'unit': 'pcs', 'qty_formula': 'conference:1'},
-                {'item': 'Conference Chair', 'unit': 'pcs', 'qty_formula': 'conference:12'},
-                {'item': 'Projector', 'unit': 'pcs', 'qty_formula': 'conference:1'},
-                {'item': 'Projection Screen', 'unit': 'pcs', 'qty_formula': 'conference:1'},
-                {'item': 'Whiteboard', 'unit': 'pcs', 'qty_formula': 'conference:1'},
-                {'item': 'Flip Chart & Stand', 'unit': 'sets', 'qty_formula': 'conference:1'},
-            ],
-            'Ballroom': [
-                {'item': 'Banquet Chair', 'unit': 'pcs', 'qty_formula': 'rooms:3'},
-                {'item': 'Banquet Table (Round)', 'unit': 'pcs', 'qty_formula': 'rooms:0.3'},
-                {'item': 'Stage Platform', 'unit': 'sets', 'qty_formula': 'fixed:1'},
-                {'item': 'Podium', 'unit': 'pcs', 'qty_formula': 'fixed:2'},
-                {'item': 'Dance Floor (Portable)', 'unit': 'sqm', 'qty_formula': 'rooms:2'},
-            ],
-        },
-
-        'Back of House': {
-            'Staff Cafeteria': [
-                {'item': 'Cafeteria Table', 'unit': 'pcs', 'qty_formula': 'rooms:0.2'},
-                {'item': 'Cafeteria Chair', 'unit': 'pcs', 'qty_formula': 'rooms:0.8'},
-                {'item': 'Microwave', 'unit': 'pcs', 'qty_formula': 'fixed:2'},
-                {'item': 'Refrigerator', 'unit': 'pcs', 'qty_formula': 'fixed:2'},
-                {'item': 'Water Cooler', 'unit': 'pcs', 'qty_formula': 'fixed:1'},
-            ],
-            'Lockers & Changing Rooms': [
-                {'item': 'Staff Locker', 'unit': 'pcs', 'qty_formula': 'rooms:0.5'},
-                {'item': 'Bench (Changing Room)', 'unit': 'pcs', 'qty_formula': 'rooms:0.1'},
-                {'item': 'Mirror', 'unit': 'pcs', 'qty_formula': 'fixed:4'},
-            ],
-            'Offices': [
-                {'item': 'Office Desk', 'unit': 'pcs', 'qty_formula': 'rooms:0.25'},
-                {'item': 'Office Chair', 'unit': 'pcs', 'qty_formula': 'rooms:0.25'},
-                {'item': 'Filing Cabinet', 'unit': 'pcs', 'qty_formula': 'fixed:5'},
-                {'item': 'Bookshelf', 'unit': 'pcs', 'qty_formula': 'rooms:0.1'},
-            ],
-        },
-    }
-
-    @classmethod
-    def get_items(cls, department, subdepartment):
-        """Get items for a specific department and subdepartment"""
-        return cls.ITEMS.get(department, {}).get(subdepartment, [])
-
-    @classmethod
-    def get_all_items_for_department(cls, department):
-        """Get all items for a department across all subdepartments"""
-        dept_data = cls.ITEMS.get(department, {})
-        all_items = []
-
-        for subdept, items in dept_data.items():
-            for item in items:
-                item_copy = item.copy()
-                item_copy['subdepartment'] = subdept
-                all_items.append(item_copy)
-
-        return all_items
+    """Standard items for each department/subdepartment (shim over the module functions)"""
+
+    # Source of truth is departments.tsv; regenerate departments_data.py with tools/gen_departments.py.
+    # All items live in one structure-of-arrays table (_ITEM_TABLE), built and checked at import.
+
+    get_items = staticmethod(get_items)
+    get_all_items_for_department = staticmethod(get_all_items_for_department)
+    get_quantities = staticmethod(get_quantities)
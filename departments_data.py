@@ -0,0 +1,157 @@
+"""
+Standard department items - GENERATED by tools/gen_departments.py from departments.tsv, do not edit
+"""
+
+# department -> ((subdepartment, item, unit, qty_kind, qty_factor, category), ...)
+ITEM_ROWS = {
+    'Front Office': (
+        ('Reception/Front Desk', 'Reception Desk', 'pcs', 'fixed', 1.0, None),
+        ('Reception/Front Desk', 'Reception Chair (Staff)', 'pcs', 'fixed', 3.0, None),
+        ('Reception/Front Desk', 'Computer Workstation', 'pcs', 'fixed', 3.0, None),
+        ('Reception/Front Desk', 'Phone System', 'sets', 'fixed', 1.0, None),
+        ('Reception/Front Desk', 'Key Card System', 'sets', 'fixed', 1.0, None),
+        ('Reception/Front Desk', 'Safe Deposit Boxes', 'pcs', 'rooms', 0.5, None),
+        ('Reception/Front Desk', 'Guest Directory/Compendium', 'pcs', 'rooms', 1.0, None),
+        ('Concierge', 'Concierge Desk', 'pcs', 'fixed', 1.0, None),
+        ('Concierge', 'Concierge Chair', 'pcs', 'fixed', 2.0, None),
+        ('Concierge', 'Brochure Display Rack', 'pcs', 'fixed', 2.0, None),
+        ('Bell Services', 'Bell Stand', 'pcs', 'fixed', 1.0, None),
+        ('Bell Services', 'Luggage Cart', 'pcs', 'rooms', 0.1, None),
+        ('Bell Services', 'Luggage Storage Rack', 'pcs', 'fixed', 3.0, None),
+    ),
+    'Housekeeping': (
+        ('Guest Rooms', 'Bed Base', 'pcs', 'beds', 1.0, 'Furniture'),
+        ('Guest Rooms', 'Mattress', 'pcs', 'beds', 1.0, 'Furniture'),
+        ('Guest Rooms', 'Bedside Table', 'pcs', 'rooms', 2.0, 'Furniture'),
+        ('Guest Rooms', 'Desk', 'pcs', 'rooms', 1.0, 'Furniture'),
+        ('Guest Rooms', 'Desk Chair', 'pcs', 'rooms', 1.0, 'Furniture'),
+        ('Guest Rooms', 'Lounge Chair', 'pcs', 'rooms', 1.0, 'Furniture'),
+        ('Guest Rooms', 'Wardrobe', 'pcs', 'rooms', 1.0, 'Furniture'),
+        ('Guest Rooms', 'TV Unit', 'pcs', 'rooms', 1.0, 'Furniture'),
+        ('Guest Rooms', 'Luggage Rack', 'pcs', 'rooms', 1.0, 'Furniture'),
+        ('Guest Rooms', 'Safe', 'pcs', 'rooms', 1.0, 'Equipment'),
+        ('Guest Rooms', 'Mirror', 'pcs', 'rooms', 2.0, 'Furniture'),
+        ('Guest Rooms', 'Waste Bin', 'pcs', 'rooms', 2.0, 'Equipment'),
+        ('Laundry', 'Commercial Washer', 'pcs', 'rooms', 0.02, None),
+        ('Laundry', 'Commercial Dryer', 'pcs', 'rooms', 0.02, None),
+        ('Laundry', 'Ironing Station', 'pcs', 'rooms', 0.01, None),
+        ('Laundry', 'Laundry Cart', 'pcs', 'rooms', 0.05, None),
+        ('Laundry', 'Folding Table', 'pcs', 'fixed', 3.0, None),
+        ('Linen Room', 'Linen Storage Shelving', 'units', 'fixed', 8.0, None),
+        ('Linen Room', 'Linen Cart', 'pcs', 'rooms', 0.1, None),
+        ('Housekeeping Office', 'Housekeeping Cart', 'pcs', 'rooms', 0.1, None),
+        ('Housekeeping Office', 'Vacuum Cleaner', 'pcs', 'rooms', 0.067, None),
+        ('Housekeeping Office', 'Floor Polisher', 'pcs', 'fixed', 2.0, None),
+        ('Housekeeping Office', 'Mop & Bucket Set', 'sets', 'rooms', 0.1, None),
+    ),
+    'Food & Beverage': (
+        ('Main Kitchen', 'Commercial Range (6-burner)', 'pcs', 'kitchen', 2.0, None),
+        ('Main Kitchen', 'Convection Oven', 'pcs', 'kitchen', 2.0, None),
+        ('Main Kitchen', 'Griddle', 'pcs', 'kitchen', 1.0, None),
+        ('Main Kitchen', 'Deep Fryer', 'pcs', 'kitchen', 2.0, None),
+        ('Main Kitchen', 'Steamer', 'pcs', 'kitchen', 1.0, None),
+        ('Main Kitchen', 'Salamander/Broiler', 'pcs', 'kitchen', 1.0, None),
+        ('Main Kitchen', 'Commercial Refrigerator', 'pcs', 'kitchen', 2.0, None),
+        ('Main Kitchen', 'Walk-in Freezer', 'pcs', 'kitchen', 1.0, None),
+        ('Main Kitchen', 'Prep Refrigerator', 'pcs', 'kitchen', 2.0, None),
+        ('Main Kitchen', 'Ice Machine', 'pcs', 'kitchen', 1.0, None),
+        ('Main Kitchen', 'Dishwasher (Commercial)', 'pcs', 'kitchen', 1.0, None),
+        ('Main Kitchen', 'Food Processor', 'pcs', 'kitchen', 2.0, None),
+        ('Main Kitchen', 'Stand Mixer', 'pcs', 'kitchen', 2.0, None),
+        ('Main Kitchen', 'Work Table (Stainless)', 'pcs', 'kitchen', 6.0, None),
+        ('Main Kitchen', 'Sink (3-compartment)', 'pcs', 'kitchen', 2.0, None),
+        ('Main Kitchen', 'Exhaust Hood', 'pcs', 'kitchen', 3.0, None),
+        ('Main Kitchen', 'Shelving Unit (Stainless)', 'pcs', 'kitchen', 8.0, None),
+        ('Restaurant - Breakfast', 'Dining Chair', 'pcs', 'seats', 1.0, None),
+        ('Restaurant - Breakfast', 'Dining Table (2-seater)', 'pcs', 'seats', 0.15, None),
+        ('Restaurant - Breakfast', 'Dining Table (4-seater)', 'pcs', 'seats', 0.25, None),
+        ('Restaurant - Breakfast', 'Service Station', 'pcs', 'restaurant', 2.0, None),
+        ('Restaurant - Breakfast', 'Host Stand', 'pcs', 'restaurant', 1.0, None),
+        ('Restaurant - A la Carte', 'Dining Chair', 'pcs', 'seats', 1.0, None),
+        ('Restaurant - A la Carte', 'Dining Table (2-seater)', 'pcs', 'seats', 0.2, None),
+        ('Restaurant - A la Carte', 'Dining Table (4-seater)', 'pcs', 'seats', 0.3, None),
+        ('Restaurant - A la Carte', 'Dining Table (6-seater)', 'pcs', 'seats', 0.125, None),
+        ('Restaurant - A la Carte', 'Bar Stool', 'pcs', 'fixed', 12.0, None),
+        ('Restaurant - A la Carte', 'Bar Counter', 'pcs', 'restaurant', 1.0, None),
+        ('Buffet Area', 'Buffet Table (Hot)', 'pcs', 'restaurant', 3.0, None),
+        ('Buffet Area', 'Buffet Table (Cold)', 'pcs', 'restaurant', 3.0, None),
+        ('Buffet Area', 'Chafing Dish', 'pcs', 'restaurant', 12.0, None),
+        ('Buffet Area', 'Ice Display Unit', 'pcs', 'restaurant', 2.0, None),
+        ('Bar/Lounge', 'Bar Counter', 'pcs', 'fixed', 1.0, None),
+        ('Bar/Lounge', 'Bar Stool', 'pcs', 'fixed', 12.0, None),
+        ('Bar/Lounge', 'Lounge Sofa', 'pcs', 'fixed', 5.0, None),
+        ('Bar/Lounge', 'Lounge Chair', 'pcs', 'fixed', 8.0, None),
+        ('Bar/Lounge', 'Coffee Table', 'pcs', 'fixed', 5.0, None),
+        ('Bar/Lounge', 'Back Bar Shelving', 'units', 'fixed', 1.0, None),
+        ('Bar/Lounge', 'Glass Washer', 'pcs', 'fixed', 1.0, None),
+        ('Bar/Lounge', 'Ice Maker', 'pcs', 'fixed', 1.0, None),
+        ('Bar/Lounge', 'Blender', 'pcs', 'fixed', 2.0, None),
+        ('Room Service', 'Room Service Cart', 'pcs', 'rooms', 0.1, None),
+        ('Room Service', 'Hot Box/Food Warmer', 'pcs', 'fixed', 3.0, None),
+        ('Room Service', 'Tray Stand', 'pcs', 'rooms', 0.2, None),
+        ('Pastry/Bakery', 'Pastry Oven', 'pcs', 'fixed', 2.0, None),
+        ('Pastry/Bakery', 'Dough Mixer', 'pcs', 'fixed', 2.0, None),
+        ('Pastry/Bakery', 'Work Table (Marble Top)', 'pcs', 'fixed', 3.0, None),
+        ('Pastry/Bakery', 'Proof Box', 'pcs', 'fixed', 1.0, None),
+        ('Pastry/Bakery', 'Display Refrigerator', 'pcs', 'fixed', 2.0, None),
+    ),
+    'Spa & Wellness': (
+        ('Treatment Rooms', 'Treatment Bed/Table', 'pcs', 'spa_rooms', 1.0, None),
+        ('Treatment Rooms', 'Stool (Therapist)', 'pcs', 'spa_rooms', 1.0, None),
+        ('Treatment Rooms', 'Side Table/Trolley', 'pcs', 'spa_rooms', 1.0, None),
+        ('Treatment Rooms', 'Storage Cabinet', 'pcs', 'spa_rooms', 1.0, None),
+        ('Treatment Rooms', 'Towel Warmer', 'pcs', 'spa_rooms', 1.0, None),
+        ('Treatment Rooms', 'Robe Hook', 'pcs', 'spa_rooms', 2.0, None),
+        ('Spa Reception', 'Reception Desk', 'pcs', 'fixed', 1.0, None),
+        ('Spa Reception', 'Reception Chair (Staff)', 'pcs', 'fixed', 2.0, None),
+        ('Spa Reception', 'Waiting Area Sofa', 'pcs', 'fixed', 2.0, None),
+        ('Spa Reception', 'Retail Display Shelving', 'units', 'fixed', 3.0, None),
+        ('Relaxation Area', 'Lounge Chair/Recliner', 'pcs', 'spa_rooms', 2.0, None),
+        ('Relaxation Area', 'Side Table', 'pcs', 'spa_rooms', 2.0, None),
+        ('Relaxation Area', 'Water Dispenser', 'pcs', 'fixed', 1.0, None),
+    ),
+    'Recreation': (
+        ('Swimming Pool', 'Pool Lounge Chair', 'pcs', 'rooms', 0.4, None),
+        ('Swimming Pool', 'Pool Umbrella', 'pcs', 'rooms', 0.2, None),
+        ('Swimming Pool', 'Side Table (Pool)', 'pcs', 'rooms', 0.2, None),
+        ('Swimming Pool', 'Life Ring', 'pcs', 'fixed', 2.0, None),
+        ('Swimming Pool', 'Pool Net/Skimmer', 'pcs', 'fixed', 2.0, None),
+        ('Swimming Pool', 'Pool Vacuum', 'pcs', 'fixed', 1.0, None),
+        ('Fitness Center/Gym', 'Treadmill', 'pcs', 'rooms', 0.08, None),
+        ('Fitness Center/Gym', 'Elliptical Trainer', 'pcs', 'rooms', 0.06, None),
+        ('Fitness Center/Gym', 'Exercise Bike', 'pcs', 'rooms', 0.06, None),
+        ('Fitness Center/Gym', 'Rowing Machine', 'pcs', 'fixed', 2.0, None),
+        ('Fitness Center/Gym', 'Weight Bench', 'pcs', 'fixed', 2.0, None),
+        ('Fitness Center/Gym', 'Dumbbell Set (5-50 lbs)', 'sets', 'fixed', 2.0, None),
+        ('Fitness Center/Gym', 'Kettlebell Set', 'sets', 'fixed', 1.0, None),
+        ('Fitness Center/Gym', 'Yoga Mat', 'pcs', 'fixed', 10.0, None),
+        ('Fitness Center/Gym', 'Mirror (Wall)', 'pcs', 'fixed', 3.0, None),
+    ),
+    'Meeting & Events': (
+        ('Conference Rooms', 'Conference Table (10-person)', 'pcs', 'conference', 1.0, None),
+        ('Conference Rooms', 'Conference Chair', 'pcs', 'conference', 12.0, None),
+        ('Conference Rooms', 'Projector', 'pcs', 'conference', 1.0, None),
+        ('Conference Rooms', 'Projection Screen', 'pcs', 'conference', 1.0, None),
+        ('Conference Rooms', 'Whiteboard', 'pcs', 'conference', 1.0, None),
+        ('Conference Rooms', 'Flip Chart & Stand', 'sets', 'conference', 1.0, None),
+        ('Ballroom', 'Banquet Chair', 'pcs', 'rooms', 3.0, None),
+        ('Ballroom', 'Banquet Table (Round)', 'pcs', 'rooms', 0.3, None),
+        ('Ballroom', 'Stage Platform', 'sets', 'fixed', 1.0, None),
+        ('Ballroom', 'Podium', 'pcs', 'fixed', 2.0, None),
+        ('Ballroom', 'Dance Floor (Portable)', 'sqm', 'rooms', 2.0, None),
+    ),
+    'Back of House': (
+        ('Staff Cafeteria', 'Cafeteria Table', 'pcs', 'rooms', 0.2, None),
+        ('Staff Cafeteria', 'Cafeteria Chair', 'pcs', 'rooms', 0.8, None),
+        ('Staff Cafeteria', 'Microwave', 'pcs', 'fixed', 2.0, None),
+        ('Staff Cafeteria', 'Refrigerator', 'pcs', 'fixed', 2.0, None),
+        ('Staff Cafeteria', 'Water Cooler', 'pcs', 'fixed', 1.0, None),
+        ('Lockers & Changing Rooms', 'Staff Locker', 'pcs', 'rooms', 0.5, None),
+        ('Lockers & Changing Rooms', 'Bench (Changing Room)', 'pcs', 'rooms', 0.1, None),
+        ('Lockers & Changing Rooms', 'Mirror', 'pcs', 'fixed', 4.0, None),
+        ('Offices', 'Office Desk', 'pcs', 'rooms', 0.25, None),
+        ('Offices', 'Office Chair', 'pcs', 'rooms', 0.25, None),
+        ('Offices', 'Filing Cabinet', 'pcs', 'fixed', 5.0, None),
+        ('Offices', 'Bookshelf', 'pcs', 'rooms', 0.1, None),
+    ),
+}
@@ -0,0 +1,65 @@
+"""
+Generate departments_data.py from departments.tsv
+
+Usage: python tools/gen_departments.py
+"""
+import csv
+import os
+from typing import List, Optional, Tuple
+
+Row = Tuple[str, str, str, str, str, float, Optional[str]]
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE = os.path.join(ROOT, 'departments.tsv')
+TARGET = os.path.join(ROOT, 'departments_data.py')
+
+HEADER = '''"""
+Standard department items - GENERATED by tools/gen_departments.py from departments.tsv, do not edit
+"""
+
+# department -> ((subdepartment, item, unit, qty_kind, qty_factor, category), ...)
+ITEM_ROWS = {
+'''
+
+
+def read_rows(path: str) -> List[Row]:
+    """Read item rows from the TSV source"""
+    with open(path, encoding='utf-8', newline='') as f:
+        reader = csv.DictReader(f, delimiter='\t')
+        return [
+            (
+                row['department'],
+                row['subdepartment'],
+                row['item'],
+                row['unit'],
+                row['qty_kind'],
+                float(row['qty_factor']),
+                row['category'] or None
+            )
+            for row in reader
+        ]
+
+
+def render(rows: List[Row]) -> str:
+    """Render rows as a Python module of per-department tuple literals"""
+    by_department = {}
+    for department, *row in rows:
+        by_department.setdefault(department, []).append(tuple(row))
+
+    body = ''
+    for department, dept_rows in by_department.items():
+        body += f"    {department!r}: (\n"
+        body += ''.join(f"        {row!r},\n" for row in dept_rows)
+        body += "    ),\n"
+    return HEADER + body + '}\n'
+
+
+def main() -> None:
+    rows = read_rows(SOURCE)
+    with open(TARGET, 'w', encoding='utf-8') as f:
+        f.write(render(rows))
+    print(f"Wrote {len(rows)} items to {TARGET}")
+
+
+if __name__ == '__main__':
+    main()